@@ -24,15 +24,20 @@ Environment:
 """
 
 import argparse
+import http.client
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# gh_http and disk_cache are shared with the github-dev-flow skill's scripts
+sys.path.append(str(Path(__file__).resolve().parents[2] / "github-dev-flow" / "scripts"))
+
+import disk_cache
+import gh_http
+from disk_cache import ONE_DAY, disk_cached
 
-# Path to github-dev-flow's project_board.py (relative within plugin)
-_SCRIPT_DIR = Path(__file__).parent.resolve()
-PROJECT_BOARD_SCRIPT = _SCRIPT_DIR / "../../github-dev-flow/scripts/project_board.py"
 
 # Priority labels mapping (CLI argument -> GitHub label)
 PRIORITY_LABELS = {
@@ -50,135 +55,317 @@ LABEL_COLORS = {
     "P: low": "c5def5",       # Light blue
 }
 
-# Cache for issue type IDs
-_issue_type_cache: dict[str, str] = {}
+# Color for labels created without an explicit color (GitHub's default gray)
+DEFAULT_LABEL_COLOR = "ededed"
+
+# Headers for preview GraphQL features
+ISSUE_TYPES_HEADERS = {"GraphQL-Features": "issue_types"}
+CREATE_LABEL_HEADERS = {"Accept": "application/vnd.github.bane-preview+json"}
+
+# GraphQL documents (module-level so they are built once)
+REPO_CONTEXT_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    issueTypes(first: 10) {
+      nodes { id, name }
+    }
+    projectsV2(first: 1) {
+      nodes {
+        id
+        field(name: "Status") {
+          ... on ProjectV2SingleSelectField {
+            id
+            options { id, name }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+SET_STATUS_MUTATION = """
+mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $optionId: String!) {
+  updateProjectV2ItemFieldValue(
+    input: {
+      projectId: $projectId
+      itemId: $itemId
+      fieldId: $fieldId
+      value: { singleSelectOptionId: $optionId }
+    }
+  ) {
+    projectV2Item { id }
+  }
+}
+"""
+
+CREATE_ISSUE_MUTATION = """
+mutation($repositoryId: ID!, $title: String!, $body: String, $labelIds: [ID!],
+         $issueTypeId: ID, $projectV2Ids: [ID!]) {
+  createIssue(input: {
+    repositoryId: $repositoryId
+    title: $title
+    body: $body
+    labelIds: $labelIds
+    issueTypeId: $issueTypeId
+    projectV2Ids: $projectV2Ids
+  }) {
+    issue {
+      number
+      url
+      projectItems(first: 10) {
+        nodes { id, project { id } }
+      }
+    }
+  }
+}
+"""
+
+# Cache of lowercased label names -> label node IDs for labels known to exist
+_label_cache: dict[str, str] = {}
 
 
-def run_gh(*args: str, check: bool = True) -> subprocess.CompletedProcess:
+def run_gh(*args: str, check: bool = True, input: str | None = None) -> subprocess.CompletedProcess:
     """Run gh CLI command."""
-    cmd = ["gh"] + list(args)
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    cmd = [gh_http.GH] + list(args)
+    result = subprocess.run(cmd, capture_output=True, text=True, input=input)
     if check and result.returncode != 0:
         print(f"Error: {result.stderr}", file=sys.stderr)
         sys.exit(1)
     return result
 
 
+def graphql(query: str, variables: dict | None = None, headers: dict[str, str] | None = None) -> dict | None:
+    """
+    Execute a GraphQL request.
+
+    Requests go over gh_http's keep-alive connection when a token is available,
+    otherwise through `gh api graphql` with the JSON body sent over stdin
+    (--input lets variables keep their JSON types: arrays, nulls).
+
+    Returns:
+        Parsed response (which may contain "errors"), or None if no JSON came back.
+    """
+    if gh_http.available():
+        try:
+            response = gh_http.graphql(query, variables, headers)
+        except (OSError, http.client.HTTPException) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return None
+        if response is None:
+            print("Error: GitHub API returned a non-JSON response", file=sys.stderr)
+        return response
+
+    args = ["api", "graphql", "--input", "-"]
+    for name, value in (headers or {}).items():
+        args.extend(["-H", f"{name}: {value}"])
+
+    payload = json.dumps({"query": query, "variables": variables or {}})
+    result = run_gh(*args, check=False, input=payload)
+
+    # gh exits non-zero on GraphQL errors but still prints the response
+    try:
+        return gh_http.loads(result.stdout)
+    except json.JSONDecodeError:
+        print(f"Error: {result.stderr.strip()}", file=sys.stderr)
+        return None
+
+
+@disk_cached("{cwd}", ttl_seconds=ONE_DAY)
 def get_repo_info() -> tuple[str, str] | None:
     """Get owner and repo name from current directory."""
     result = run_gh("repo", "view", "--json", "owner,name", check=False)
     if result.returncode != 0:
         return None
-    data = json.loads(result.stdout)
+    data = gh_http.loads(result.stdout)
     return data["owner"]["login"], data["name"]
 
 
-def get_issue_type_id(owner: str, repo: str, type_name: str) -> str | None:
-    """Get issue type ID via GraphQL. Returns None if not available."""
-    cache_key = f"{owner}/{repo}"
+def get_repo_context(owner: str, repo: str) -> dict | None:
+    """
+    Resolve repository ID, issue types, and project Status field in one query.
 
-    # Check cache first
-    if cache_key not in _issue_type_cache:
-        query = """
-        query($owner: String!, $name: String!) {
-          repository(owner: $owner, name: $name) {
-            issueTypes(first: 10) {
-              nodes { id, name }
-            }
-          }
+    Results are cached on disk for a day since these IDs rarely change.
+
+    Returns:
+        Dict with "repositoryId", "issueTypes" ({lowercase name: id}), and
+        "project" ({"id", "statusFieldId", "statusOptions"} or None).
+    """
+    cache_key = f"repo-context:{owner}/{repo}"
+    cached = disk_cache.read(cache_key)
+    if cached is not None:
+        return cached
+
+    response = graphql(REPO_CONTEXT_QUERY, {"owner": owner, "name": repo}, headers=ISSUE_TYPES_HEADERS)
+    repository = ((response or {}).get("data") or {}).get("repository")
+    if not repository:
+        return None
+
+    types = (repository.get("issueTypes") or {}).get("nodes") or []
+    projects = (repository.get("projectsV2") or {}).get("nodes") or []
+
+    project = None
+    if projects and projects[0].get("field"):
+        field = projects[0]["field"]
+        project = {
+            "id": projects[0]["id"],
+            "statusFieldId": field["id"],
+            "statusOptions": field.get("options", []),
         }
-        """
-        result = subprocess.run(
-            ["gh", "api", "graphql",
-             "-H", "GraphQL-Features: issue_types",
-             "-f", f"query={query}",
-             "-f", f"owner={owner}",
-             "-f", f"name={repo}"],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            return None
 
-        try:
-            data = json.loads(result.stdout)
-            types = data.get("data", {}).get("repository", {}).get("issueTypes", {}).get("nodes", [])
-            _issue_type_cache[cache_key] = {t["name"].lower(): t["id"] for t in types}
-        except (json.JSONDecodeError, KeyError):
-            return None
+    context = {
+        "repositoryId": repository["id"],
+        "issueTypes": {t["name"].lower(): t["id"] for t in types},
+        "project": project,
+    }
 
-    return _issue_type_cache.get(cache_key, {}).get(type_name.lower())
+    # Partial responses (e.g. missing project scope) are not cached
+    if "errors" not in response:
+        disk_cache.write(cache_key, context, ONE_DAY)
 
+    return context
 
-def get_issue_node_id(issue_number: int) -> str | None:
-    """Get the GraphQL node ID for an issue."""
-    result = run_gh("issue", "view", str(issue_number), "--json", "id", check=False)
-    if result.returncode != 0:
-        return None
-    try:
-        return json.loads(result.stdout)["id"]
-    except (json.JSONDecodeError, KeyError):
-        return None
 
+def _fetch_labels(owner: str, repo: str, names: list[str]) -> str | None:
+    """
+    Look up specific labels by name and record the ones that exist.
 
-def set_issue_type(issue_node_id: str, issue_type_id: str) -> bool:
-    """Set the issue type via GraphQL mutation."""
-    mutation = """
-    mutation($issueId: ID!, $issueTypeId: ID!) {
-      updateIssueIssueType(input: { issueId: $issueId, issueTypeId: $issueTypeId }) {
-        issue { id }
-      }
-    }
+    Each name is an aliased repository.label() lookup (case-insensitive on
+    GitHub's side), so only the requested labels come back instead of the
+    repo's full label list.
+
+    Returns:
+        Repository node ID, or None if the query failed.
     """
-    result = subprocess.run(
-        ["gh", "api", "graphql",
-         "-H", "GraphQL-Features: issue_types",
-         "-f", f"query={mutation}",
-         "-f", f"issueId={issue_node_id}",
-         "-f", f"issueTypeId={issue_type_id}"],
-        capture_output=True, text=True
+    params = ["$owner: String!", "$name: String!"]
+    selections = []
+    variables = {"owner": owner, "name": repo}
+    for i, name in enumerate(names):
+        params.append(f"$label{i}: String!")
+        selections.append(f"l{i}: label(name: $label{i}) {{ id name }}")
+        variables[f"label{i}"] = name
+
+    query = (
+        f"query({', '.join(params)}) {{\n"
+        f"  repository(owner: $owner, name: $name) {{\n    id\n    "
+        + "\n    ".join(selections)
+        + "\n  }\n}"
     )
-    return result.returncode == 0
+    response = graphql(query, variables)
+    repository = ((response or {}).get("data") or {}).get("repository")
+    if not repository:
+        return None
+
+    for i, name in enumerate(names):
+        label = repository.get(f"l{i}")
+        if label:
+            _label_cache[name.lower()] = label["id"]
+    return repository["id"]
+
 
+def ensure_labels_exist(
+    owner: str,
+    repo: str,
+    labels: list[tuple[str, str | None, str | None]],
+) -> dict[str, str]:
+    """
+    Create any missing labels with a single batched GraphQL mutation.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        labels: (name, color, description) tuples for the labels to ensure
 
-def ensure_label_exists(label: str, color: str | None = None, description: str | None = None) -> None:
+    Returns:
+        Mapping of lowercased label name to label node ID for the labels that
+        exist; labels that couldn't be looked up or created are left out.
+    """
+    # Lowercase each name once; the cache (a dict) gives O(1) membership checks
+    keys = [name.lower() for name, _, _ in labels]
+
+    def resolved() -> dict[str, str]:
+        return {key: _label_cache[key] for key in keys if key in _label_cache}
+
+    unknown = [entry[0] for entry, key in zip(labels, keys) if key not in _label_cache]
+    if not unknown:
+        return resolved()
+
+    repo_id = _fetch_labels(owner, repo, unknown)
+    if not repo_id:
+        return resolved()
+
+    missing = [entry for entry, key in zip(labels, keys) if key not in _label_cache]
+    if not missing:
+        return resolved()
+
+    # One aliased createLabel per missing label, all in one document
+    params = ["$repositoryId: ID!"]
+    selections = []
+    variables = {"repositoryId": repo_id}
+
+    for i, (name, color, description) in enumerate(missing):
+        params.extend([f"$name{i}: String!", f"$color{i}: String!", f"$description{i}: String"])
+        selections.append(
+            f"c{i}: createLabel(input: {{ repositoryId: $repositoryId, name: $name{i}, "
+            f"color: $color{i}, description: $description{i} }}) {{ label {{ id name }} }}"
+        )
+        variables[f"name{i}"] = name
+        variables[f"color{i}"] = color or DEFAULT_LABEL_COLOR
+        variables[f"description{i}"] = description
+
+    mutation = f"mutation({', '.join(params)}) {{\n  " + "\n  ".join(selections) + "\n}"
+    response = graphql(mutation, variables, headers=CREATE_LABEL_HEADERS)
+
+    # Record whatever was created, even if other aliases in the batch failed
+    created = (response or {}).get("data") or {}
+    for i in range(len(missing)):
+        label = (created.get(f"c{i}") or {}).get("label")
+        if label:
+            _label_cache[label["name"].lower()] = label["id"]
+
+    if not response or "errors" in response:
+        errors = (response or {}).get("errors", [])
+        print(f"Error: Could not create labels: {errors}", file=sys.stderr)
+
+    return resolved()
+
+
+def ensure_label_exists(
+    owner: str,
+    repo: str,
+    label: str,
+    color: str | None = None,
+    description: str | None = None,
+) -> None:
     """Create label if it doesn't exist."""
-    result = run_gh("label", "list", "--json", "name", check=False)
-    if result.returncode != 0:
-        return
+    ensure_labels_exist(owner, repo, [(label, color, description)])
 
-    labels = json.loads(result.stdout)
-    existing = [l["name"].lower() for l in labels]
 
-    if label.lower() not in existing:
-        args = ["label", "create", label]
-        if color:
-            args.extend(["--color", color])
-        if description:
-            args.extend(["--description", description])
-        run_gh(*args, check=False)
+def _find_status_option(options: list[dict], status: str) -> str | None:
+    """Match a status name to a Status option ID (case-insensitive, normalize spaces)."""
+    target = status.lower().replace("-", " ").replace("_", " ")
+    for opt in options:
+        if opt["name"].lower().replace("-", " ").replace("_", " ") == target:
+            return opt["id"]
+    return None
 
 
-def add_to_project_board(issue_number: int, status: str = "todo") -> bool:
-    """Add issue to project board using github-dev-flow's script."""
-    if not PROJECT_BOARD_SCRIPT.exists():
-        print(f"Warning: project_board.py not found at {PROJECT_BOARD_SCRIPT}", file=sys.stderr)
+def set_project_status(project: dict, item_id: str, status: str) -> bool:
+    """Set the Status field of a project item."""
+    option_id = _find_status_option(project["statusOptions"], status)
+    if not option_id:
+        available = ", ".join(f'"{opt["name"]}"' for opt in project["statusOptions"])
+        print(f"Warning: Status '{status}' not found. Available: {available}", file=sys.stderr)
         return False
 
-    try:
-        result = subprocess.run(
-            ["uv", "run", "python", str(PROJECT_BOARD_SCRIPT), "move", str(issue_number), "--to", status],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            print(result.stdout.strip())
-            return True
-        else:
-            print(f"Warning: Could not add to project board: {result.stderr.strip()}", file=sys.stderr)
-            return False
-    except Exception as e:
-        print(f"Warning: Project board error: {e}", file=sys.stderr)
-        return False
+    response = graphql(SET_STATUS_MUTATION, {
+        "projectId": project["id"],
+        "itemId": item_id,
+        "fieldId": project["statusFieldId"],
+        "optionId": option_id,
+    })
+    return bool(response) and "errors" not in response
 
 
 def create_issue(
@@ -194,12 +381,15 @@ def create_issue(
     """
     Create a GitHub issue with priority label and optional issue type.
 
+    Labels, issue type, and project board membership are all set by a single
+    createIssue mutation; only the board column needs a follow-up update.
+
     Args:
         title: Issue title
         issue_type: GitHub native issue type (bug, feature, task)
         priority: Priority level (critical, high, medium, low)
         body: Issue body text
-        body_file: Path to file containing issue body
+        body_file: Path to file containing issue body ("-" for stdin)
         labels: Additional labels to add
         add_to_project: Whether to add to project board
         project_status: Project board column (default: todo)
@@ -207,6 +397,14 @@ def create_issue(
     Returns:
         Issue number on success, None on failure.
     """
+    # Read the body before any network calls so a bad path fails fast
+    if body_file:
+        try:
+            body = sys.stdin.read() if body_file == "-" else Path(body_file).read_text()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error: Could not read body file: {e}", file=sys.stderr)
+            return None
+
     # Get priority label
     priority_label = PRIORITY_LABELS.get(priority.lower(), PRIORITY_LABELS["medium"])
     final_labels = [priority_label]
@@ -215,56 +413,77 @@ def create_issue(
     if labels:
         final_labels.extend(labels)
 
-    # Ensure priority label exists with appropriate color
-    ensure_label_exists(priority_label, color=LABEL_COLORS.get(priority_label))
+    repo_info = get_repo_info()
+    if not repo_info:
+        print("Error: Could not detect GitHub repository.", file=sys.stderr)
+        return None
+
+    # Label checks and the context lookup are independent network calls, so run
+    # them concurrently (each worker thread keeps its own API connection)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Ensure all labels exist (priority labels get their configured color)
+        labels_future = executor.submit(
+            ensure_labels_exist,
+            *repo_info,
+            [(label, LABEL_COLORS.get(label), None) for label in final_labels],
+        )
+        context = executor.submit(get_repo_context, *repo_info).result()
+        label_ids = labels_future.result()
 
-    # Build command
-    args = ["issue", "create", "--title", title]
+    if not context:
+        print(f"Error: Could not resolve repository {'/'.join(repo_info)}", file=sys.stderr)
+        return None
 
-    if body_file:
-        args.extend(["--body-file", body_file])
-    elif body:
-        args.extend(["--body", body])
-    else:
-        args.extend(["--body", ""])
-
-    for label in final_labels:
-        args.extend(["--label", label])
-
-    # Create the issue
-    result = run_gh(*args)
-    output = result.stdout.strip()
-
-    # Parse issue URL to get number
-    # Output is like: https://github.com/owner/repo/issues/123
-    if "/issues/" in output:
-        issue_number = int(output.split("/issues/")[-1])
-        print(f"Created issue #{issue_number}: {output}")
-
-        # Set issue type via GraphQL if specified
-        if issue_type:
-            repo_info = get_repo_info()
-            if repo_info:
-                owner, repo = repo_info
-                type_id = get_issue_type_id(owner, repo, issue_type)
-                if type_id:
-                    issue_node_id = get_issue_node_id(issue_number)
-                    if issue_node_id and set_issue_type(issue_node_id, type_id):
-                        print(f"Set issue type: {issue_type.capitalize()}")
-                    else:
-                        print(f"Warning: Could not set issue type", file=sys.stderr)
-                else:
-                    print(f"Warning: Issue type '{issue_type}' not available in this repo", file=sys.stderr)
-
-        # Add to project board
-        if add_to_project:
-            add_to_project_board(issue_number, project_status)
-
-        return issue_number
-    else:
-        print(f"Issue created: {output}")
+    # Like `gh issue create --label`, refuse to create the issue without a requested label
+    unresolved = [label for label in final_labels if label.lower() not in label_ids]
+    if unresolved:
+        print(f"Error: Could not find or create labels: {', '.join(unresolved)}", file=sys.stderr)
         return None
 
+    type_id = None
+    if issue_type:
+        type_id = context["issueTypes"].get(issue_type.lower())
+        if not type_id:
+            print(f"Warning: Issue type '{issue_type}' not available in this repo", file=sys.stderr)
+
+    project = context["project"] if add_to_project else None
+    if add_to_project and not project:
+        print("Warning: Could not add to project board: no project found for repository", file=sys.stderr)
+
+    response = graphql(CREATE_ISSUE_MUTATION, {
+        "repositoryId": context["repositoryId"],
+        "title": title,
+        "body": body or "",
+        "labelIds": list(label_ids.values()),
+        "issueTypeId": type_id,
+        "projectV2Ids": [project["id"]] if project else None,
+    }, headers=ISSUE_TYPES_HEADERS)
+
+    issue = (((response or {}).get("data") or {}).get("createIssue") or {}).get("issue")
+    if not issue:
+        errors = (response or {}).get("errors", [])
+        print(f"Error: Could not create issue: {errors}", file=sys.stderr)
+        return None
+
+    issue_number = issue["number"]
+    print(f"Created issue #{issue_number}: {issue['url']}")
+
+    if type_id:
+        print(f"Set issue type: {issue_type.capitalize()}")
+
+    # Move the new project item into the requested column
+    if project:
+        item_id = next(
+            (n["id"] for n in issue["projectItems"]["nodes"] if n["project"]["id"] == project["id"]),
+            None,
+        )
+        if item_id and set_project_status(project, item_id, project_status):
+            print(f"Moved issue #{issue_number} to '{project_status}'")
+        else:
+            print("Warning: Could not add to project board", file=sys.stderr)
+
+    return issue_number
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -291,7 +510,7 @@ def main():
     )
     parser.add_argument(
         "--body-file", "-f",
-        help="Read issue body from file",
+        help="Read issue body from file (use - for stdin)",
     )
     parser.add_argument(
         "--label", "-l",
@@ -309,6 +528,11 @@ def main():
         default="todo",
         help="Project board status/column (default: todo)",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached repository lookups and refetch them",
+    )
 
     args = parser.parse_args()
 
@@ -316,6 +540,8 @@ def main():
         print("Error: Either --body or --body-file is required", file=sys.stderr)
         sys.exit(1)
 
+    disk_cache.set_refresh(args.refresh)
+
     issue_number = create_issue(
         title=args.title,
         issue_type=args.type,
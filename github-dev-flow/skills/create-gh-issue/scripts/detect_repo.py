@@ -9,16 +9,119 @@ Returns owner/repo string (e.g., "anthropics/claude-code")
 """
 
 import argparse
+import os
 import re
+import shutil
 import subprocess
 import sys
+from functools import lru_cache
+from pathlib import Path
+
+
+# git resolved against PATH once, instead of on every exec
+GIT = shutil.which("git") or "git"
+
+# [remote "<name>"] section header followed by its url = <value> line
+_REMOTE_RE = re.compile(rb'^\[remote "([^"]+)"\][^\[]*?^\s*url\s*=\s*(\S+)', re.M | re.S)
+
+# Config that can make `git remote get-url` differ from the raw url = line:
+# url.<base>.insteadOf rewrites, and [include]/[includeIf] files that may add them
+_CONFIG_REWRITE_MARKERS = (b"insteadof", b"include")
+
+# Environment variables that change which repository or config files git reads
+_GIT_ENV_OVERRIDES = (
+    "GIT_DIR",
+    "GIT_COMMON_DIR",
+    "GIT_CONFIG",
+    "GIT_CONFIG_GLOBAL",
+    "GIT_CONFIG_SYSTEM",
+    "GIT_CONFIG_COUNT",
+    "GIT_CONFIG_PARAMETERS",
+)
+
+# GitHub remote URL formats
+_GH_PATTERNS = [
+    # SSH format: git@github.com:owner/repo.git
+    re.compile(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$"),
+    # HTTPS format: https://github.com/owner/repo.git
+    re.compile(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?$"),
+]
+
+
+def _may_rewrite(config: bytes) -> bool:
+    """Whether a config file could change how git resolves a remote URL."""
+    config = config.lower()
+    return any(marker in config for marker in _CONFIG_REWRITE_MARKERS)
+
+
+@lru_cache(maxsize=1)
+def _global_config_may_rewrite() -> bool:
+    """Whether the global or system git config could rewrite remote URLs."""
+    home = Path.home()
+    xdg_config = Path(os.environ.get("XDG_CONFIG_HOME") or home / ".config")
+    candidates = [
+        home / ".gitconfig",
+        xdg_config / "git" / "config",
+        Path("/etc/gitconfig"),
+        # System config of a git installed under another prefix (e.g. /usr/local)
+        Path(GIT).resolve().parent.parent / "etc" / "gitconfig",
+    ]
+    for path in candidates:
+        try:
+            if _may_rewrite(path.read_bytes()):
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def _read_remote_from_config(remote: str) -> str | None:
+    """
+    Read a remote URL straight from .git/config, avoiding a git subprocess.
+
+    Returns None whenever git could resolve the URL differently: worktrees and
+    submodules where .git is a file, GIT_DIR/GIT_CONFIG* overrides, quoted
+    values, and insteadOf rewrites or includes in the repo, global or system config.
+    """
+    if any(name in os.environ for name in _GIT_ENV_OVERRIDES):
+        return None
+
+    for directory in (Path.cwd(), *Path.cwd().parents):
+        git_dir = directory / ".git"
+        if git_dir.exists():
+            break
+    else:
+        return None
+
+    if not git_dir.is_dir():
+        return None
+
+    try:
+        config = (git_dir / "config").read_bytes()
+    except OSError:
+        return None
+
+    if _may_rewrite(config) or _global_config_may_rewrite():
+        return None
+
+    for name, url in _REMOTE_RE.findall(config):
+        if name.decode() == remote:
+            # Quoted or escaped values need git's own parsing
+            if url.startswith(b'"') or b"\\" in url:
+                return None
+            return url.decode()
+    return None
 
 
 def get_remote_url(remote: str = "origin") -> str | None:
     """Get the URL of a git remote."""
+    url = _read_remote_from_config(remote)
+    if url:
+        return url
+
     try:
         result = subprocess.run(
-            ["git", "remote", "get-url", remote],
+            [GIT, "remote", "get-url", remote],
             capture_output=True,
             text=True,
             check=True,
@@ -37,15 +140,8 @@ def parse_github_url(url: str) -> str | None:
     - HTTPS: https://github.com/owner/repo.git
     - HTTPS (no .git): https://github.com/owner/repo
     """
-    patterns = [
-        # SSH format: git@github.com:owner/repo.git
-        r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$",
-        # HTTPS format: https://github.com/owner/repo.git
-        r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?$",
-    ]
-
-    for pattern in patterns:
-        match = re.match(pattern, url)
+    for pattern in _GH_PATTERNS:
+        match = pattern.match(url)
         if match:
             owner, repo = match.groups()
             return f"{owner}/{repo}"
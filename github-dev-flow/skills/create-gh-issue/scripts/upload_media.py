@@ -5,7 +5,7 @@ Upload media files to GitHub repository for issue embedding.
 Uploads files to .github/issue-assets/ folder and returns markdown image syntax.
 
 Usage:
-    uv run python upload_media.py <file_path> [--repo OWNER/REPO] [--branch BRANCH]
+    uv run python upload_media.py <file_path> [--repo OWNER/REPO] [--branch BRANCH] [--force]
 
 Returns:
     Markdown image syntax: ![alt](url)
@@ -14,31 +14,65 @@ Returns:
 import argparse
 import base64
 import hashlib
+import http.client
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# gh_http and disk_cache are shared with the github-dev-flow skill's scripts
+sys.path.append(str(Path(__file__).resolve().parents[2] / "github-dev-flow" / "scripts"))
+
+import disk_cache
+import gh_http
+from disk_cache import ONE_DAY
+
+
+def api(method: str, path: str, payload: dict | None = None) -> tuple[dict | None, str | None]:
+    """
+    Call the GitHub REST API.
+
+    Uses gh_http's keep-alive connection when a token is available, otherwise
+    `gh api` with any JSON body streamed over stdin.
+
+    Returns:
+        Tuple of (parsed response, None) on success or (None, error message).
+    """
+    if gh_http.available():
+        try:
+            status, data = gh_http.request(method, path, payload)
+        except (OSError, http.client.HTTPException) as e:
+            return None, str(e)
+        if 200 <= status < 300:
+            return data, None
+        message = data.get("message") if isinstance(data, dict) else None
+        return None, f"HTTP {status}: {message or 'request failed'}"
+
+    cmd = [gh_http.GH, "api", path, "-X", method]
+    if payload is not None:
+        cmd.extend(["--input", "-"])
 
-def get_gh_token() -> str | None:
-    """Get GitHub token from gh CLI."""
     try:
         result = subprocess.run(
-            ["gh", "auth", "token"],
+            cmd,
+            input=json.dumps(payload) if payload is not None else None,
             capture_output=True,
             text=True,
             check=True,
         )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return None
+        return gh_http.loads(result.stdout), None
+    except subprocess.CalledProcessError as e:
+        return None, e.stderr.strip()
+    except json.JSONDecodeError:
+        return None, "invalid JSON response"
 
 
 def detect_repo() -> str | None:
     """Detect repo from current directory."""
     try:
         result = subprocess.run(
-            ["gh", "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"],
+            [gh_http.GH, "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"],
             capture_output=True,
             text=True,
             check=True,
@@ -48,57 +82,107 @@ def detect_repo() -> str | None:
         return None
 
 
+def api_get_cached(path: str, ttl_seconds: int) -> dict | None:
+    """
+    GET a REST resource through the disk cache.
+
+    With gh_http, an expired entry is revalidated with If-None-Match, so an
+    unchanged resource costs a bodyless 304 and just refreshes the timestamp.
+    """
+    key = f"api:{path}"
+    cached = disk_cache.read(key)
+    if cached is not None:
+        return cached
+
+    if not gh_http.available():
+        data, _ = api("GET", path)
+        if data is not None:
+            disk_cache.write(key, data, ttl_seconds)
+        return data
+
+    entry = disk_cache.read_entry(key) or {}
+    try:
+        status, data, etag = gh_http.get_conditional(path, entry.get("etag"))
+    except (OSError, http.client.HTTPException):
+        return None
+
+    if status == 304 and "data" in entry:
+        data = entry["data"]
+    elif status != 200:
+        return None
+    disk_cache.write(key, data, ttl_seconds, etag)
+    return data
+
+
+def _fetch_default_branch(repo: str) -> str | None:
+    """Fetch the default branch from the GitHub API (cached on disk)."""
+    data = api_get_cached(f"repos/{repo}", ttl_seconds=ONE_DAY)
+    return (data or {}).get("default_branch") or None
+
+
 def get_default_branch(repo: str) -> str:
     """Get the default branch for a repository."""
-    try:
-        result = subprocess.run(
-            ["gh", "api", f"repos/{repo}", "-q", ".default_branch"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return "main"
+    return _fetch_default_branch(repo) or "main"
+
+
+def get_remote_file(repo: str, branch: str, path: str) -> dict | None:
+    """
+    Look up a file in the repository.
+
+    Returns:
+        Dict with "sha" and "download_url", or None if the file doesn't exist.
+    """
+    data, _ = api("GET", f"repos/{repo}/contents/{path}?ref={branch}")
+    if not isinstance(data, dict):
+        return None
+    return {"sha": data.get("sha"), "download_url": data.get("download_url")}
 
 
 def file_exists_in_repo(repo: str, branch: str, path: str) -> bool:
     """Check if a file exists in the repository."""
-    try:
-        subprocess.run(
-            ["gh", "api", f"repos/{repo}/contents/{path}?ref={branch}"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    return get_remote_file(repo, branch, path) is not None
+
 
+def file_sha256(local_path: Path) -> str:
+    """
+    Hash a file without loading it into memory.
 
-def upload_file(repo: str, branch: str, local_path: Path, remote_path: str) -> str | None:
+    hashlib.file_digest (Python 3.11+) streams through OpenSSL, which uses
+    hardware SHA instructions where available.
+    """
+    with local_path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def read_and_hash(local_path: Path) -> tuple[bytes, str]:
+    """Read a file once, returning its raw bytes and SHA-256 hex digest."""
+    content = local_path.read_bytes()
+    return content, hashlib.sha256(content).hexdigest()
+
+
+def upload_file(
+    repo: str,
+    branch: str,
+    local_path: Path,
+    remote_path: str,
+    content: bytes,
+    sha: str | None = None,
+) -> str | None:
     """
     Upload a file to GitHub repository.
 
+    Args:
+        sha: Blob SHA of the existing remote file, required to overwrite it
+
     Returns the raw URL for the file.
     """
-    # Read and encode file
-    content = local_path.read_bytes()
     content_b64 = base64.b64encode(content).decode("utf-8")
 
-    # Check if file already exists (need SHA for update)
-    sha = None
-    try:
-        result = subprocess.run(
-            ["gh", "api", f"repos/{repo}/contents/{remote_path}?ref={branch}", "-q", ".sha"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        sha = result.stdout.strip()
-    except subprocess.CalledProcessError:
-        pass  # File doesn't exist yet
-
     # Prepare API payload
     payload = {
         "message": f"Add issue asset: {local_path.name}",
@@ -108,36 +192,23 @@ def upload_file(repo: str, branch: str, local_path: Path, remote_path: str) -> s
     if sha:
         payload["sha"] = sha
 
-    # Upload via GitHub API
-    try:
-        result = subprocess.run(
-            [
-                "gh", "api",
-                f"repos/{repo}/contents/{remote_path}",
-                "-X", "PUT",
-                "-f", f"message={payload['message']}",
-                "-f", f"content={content_b64}",
-                "-f", f"branch={branch}",
-            ] + (["-f", f"sha={sha}"] if sha else []),
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+    # Upload via GitHub API; the JSON body never goes through argv
+    response, error = api("PUT", f"repos/{repo}/contents/{remote_path}", payload)
+    if error:
+        print(f"Error uploading file: {error}", file=sys.stderr)
+        return None
 
-        # Parse response to get the download URL
-        response = json.loads(result.stdout)
-        download_url = response.get("content", {}).get("download_url")
-        return download_url
+    # Parse response to get the download URL
+    return (response or {}).get("content", {}).get("download_url")
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error uploading file: {e.stderr}", file=sys.stderr)
-        return None
 
+def generate_asset_path(local_path: Path, digest: str | None = None) -> str:
+    """
+    Generate a unique asset path based on file content hash.
 
-def generate_asset_path(local_path: Path) -> str:
-    """Generate a unique asset path based on file content hash."""
-    content = local_path.read_bytes()
-    content_hash = hashlib.sha256(content).hexdigest()[:12]
+    Pass a precomputed SHA-256 digest to avoid hashing the file again.
+    """
+    content_hash = (digest or file_sha256(local_path))[:12]
     suffix = local_path.suffix.lower()
     return f".github/issue-assets/{content_hash}{suffix}"
 
@@ -146,10 +217,14 @@ def upload_media(
     file_path: str,
     repo: str | None = None,
     branch: str | None = None,
+    force: bool = False,
 ) -> tuple[str | None, str | None]:
     """
     Upload media file and return markdown syntax.
 
+    Asset paths are content-addressed, so if the path already exists the
+    existing URL is returned without re-uploading (unless force is set).
+
     Returns:
         Tuple of (markdown_syntax, raw_url) or (None, None) on failure.
     """
@@ -166,15 +241,25 @@ def upload_media(
             print("Error: Could not detect repository. Use --repo flag.", file=sys.stderr)
             return None, None
 
-    # Get default branch if not provided
-    if not branch:
-        branch = get_default_branch(repo)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Look up the default branch while the file is hashed locally
+        branch_future = None if branch else executor.submit(get_default_branch, repo)
 
-    # Generate unique asset path
-    remote_path = generate_asset_path(local_path)
+        # Read the file once; the same bytes are hashed and, if needed, uploaded
+        content, digest = read_and_hash(local_path)
+        remote_path = generate_asset_path(local_path, digest)
 
-    # Upload file
-    raw_url = upload_file(repo, branch, local_path, remote_path)
+        if branch_future:
+            branch = branch_future.result()
+
+    remote = get_remote_file(repo, branch, remote_path)
+
+    if remote and not force:
+        # Same path means same content hash, so the existing copy is identical
+        raw_url = remote.get("download_url")
+    else:
+        sha = remote.get("sha") if remote else None
+        raw_url = upload_file(repo, branch, local_path, remote_path, content, sha)
 
     if not raw_url:
         return None, None
@@ -207,9 +292,21 @@ def main():
         action="store_true",
         help="Output only the raw URL, not markdown syntax",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached repository lookups and refetch them",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Upload even if an identical asset already exists",
+    )
     args = parser.parse_args()
 
-    markdown, raw_url = upload_media(args.file_path, args.repo, args.branch)
+    disk_cache.set_refresh(args.refresh)
+
+    markdown, raw_url = upload_media(args.file_path, args.repo, args.branch, args.force)
 
     if markdown and raw_url:
         if args.url_only:
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+On-disk JSON cache for GitHub lookups that rarely change.
+
+Entries are stored in ~/.cache/gh-dev-flow/<sha256 of key>.json as
+{"data": ..., "ts": ..., "ttl": ..., "etag": ...} and shared between script
+invocations. The optional ETag lets expired REST entries be revalidated.
+
+Usage:
+    from disk_cache import disk_cached
+
+    @disk_cached("default-branch:{0}", ttl_seconds=ONE_DAY)
+    def get_default_branch(repo: str) -> str | None:
+        ...
+
+    # Bypass cached values (e.g. for a --refresh flag)
+    disk_cache.set_refresh(True)
+"""
+
+import functools
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+CACHE_DIR = Path.home() / ".cache" / "gh-dev-flow"
+
+ONE_HOUR = 60 * 60
+ONE_DAY = 24 * ONE_HOUR
+
+# When set, reads miss so every lookup is refetched (and written back)
+_refresh = False
+
+
+def set_refresh(refresh: bool) -> None:
+    """Enable or disable bypassing cached entries."""
+    global _refresh
+    _refresh = refresh
+
+
+def _cache_path(key: str) -> Path:
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def read_entry(key: str) -> dict | None:
+    """Return the raw cache entry for key, even if expired (e.g. to reuse its ETag)."""
+    try:
+        entry = json.loads(_cache_path(key).read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def read(key: str) -> Any | None:
+    """Return cached data for key, or None if missing, expired, or refreshing."""
+    if _refresh:
+        return None
+    try:
+        entry = json.loads(_cache_path(key).read_text())
+        if time.time() - entry["ts"] < entry["ttl"]:
+            return entry["data"]
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+    return None
+
+
+def write(key: str, data: Any, ttl_seconds: int, etag: str | None = None) -> None:
+    """Store data for key. Failures are ignored; the cache is best-effort."""
+    path = _cache_path(key)
+    entry = {"data": data, "ts": time.time(), "ttl": ttl_seconds}
+    if etag:
+        entry["etag"] = etag
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def disk_cached(key: str, ttl_seconds: int) -> Callable:
+    """
+    Cache a function's JSON-serializable result on disk.
+
+    Args:
+        key: Format string filled with the call's positional arguments and
+            the current directory, e.g. "default-branch:{0}" or "repo:{cwd}"
+        ttl_seconds: How long a cached result stays valid
+
+    None results are never cached, so failed lookups are retried next time.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args):
+            cache_key = f"{func.__name__}:" + key.format(*args, cwd=os.getcwd())
+            cached = read(cache_key)
+            if cached is not None:
+                return cached
+            result = func(*args)
+            if result is not None:
+                write(cache_key, result, ttl_seconds)
+            return result
+        return wrapper
+    return decorator
@@ -36,15 +36,25 @@ Environment:
 """
 
 import argparse
+import http.client
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
-from collections import defaultdict
+import urllib.error
+import urllib.request
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import disk_cache
+import gh_http
+from disk_cache import ONE_HOUR, disk_cached
+
 
 # Priority labels in order (highest to lowest)
 PRIORITY_ORDER = ["P: Critical", "P: HIGH", "P: Medium", "P: low"]
@@ -52,10 +62,86 @@ PRIORITY_ORDER = ["P: Critical", "P: HIGH", "P: Medium", "P: low"]
 # Columns where agent can pickup work
 PICKUP_COLUMNS = ["todo", "dev ready"]
 
+# Explicit cap for `gh issue list` (its default is only 30)
+ISSUE_LIST_LIMIT = 200
+
+# Per-output-directory record of downloaded images: {url: {"etag", "filename"}}
+ETAG_CACHE_FILE = ".etag_cache.json"
+
+# Chunk size for streaming image downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Patterns for slugify, compiled once
+_SLUG_STRIP = re.compile(r'[^a-z0-9\s-]')
+# Underscores are already stripped, so any run of whitespace/dashes becomes one dash
+_SLUG_SEPARATOR = re.compile(r'[\s-]+')
+
+# GitHub-hosted image URLs in markdown and <img> tags
+_IMG_PATTERNS = [
+    re.compile(r'!\[.*?\]\((https://(?:user-images\.githubusercontent\.com|github\.com/user-attachments)[^\)]+)\)'),
+    re.compile(r'<img[^>]+src=["\']?(https://(?:user-images\.githubusercontent\.com|github\.com/user-attachments)[^"\'\s>]+)'),
+]
+
+# Open issues with the fields pickup needs, including each project item's Status
+OPEN_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(states: OPEN, first: 100, after: $cursor) {
+      nodes {
+        number
+        title
+        state
+        createdAt
+        labels(first: 20) { nodes { name } }
+        milestone { title }
+        projectItems(first: 5) {
+          nodes {
+            fieldValueByName(name: "Status") {
+              ... on ProjectV2ItemFieldSingleSelectValue { name }
+            }
+          }
+        }
+      }
+      pageInfo { hasNextPage, endCursor }
+    }
+  }
+}
+"""
+
+
+# Items on a project board with their Status and issue details
+PROJECT_ITEMS_QUERY = """
+query($projectId: ID!, $cursor: String) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      items(first: 100, after: $cursor) {
+        nodes {
+          fieldValueByName(name: "Status") {
+            ... on ProjectV2ItemFieldSingleSelectValue { name }
+          }
+          content {
+            ... on Issue {
+              number
+              title
+              state
+              createdAt
+              repository { nameWithOwner }
+              labels(first: 20) { nodes { name } }
+              milestone { title }
+            }
+          }
+        }
+        pageInfo { hasNextPage, endCursor }
+      }
+    }
+  }
+}
+"""
+
 
 def run_gh(*args: str, capture: bool = True, check: bool = True) -> str:
     """Run gh CLI command."""
-    cmd = ["gh"] + list(args)
+    cmd = [gh_http.GH] + list(args)
     result = subprocess.run(cmd, capture_output=capture, text=True)
     if check and result.returncode != 0:
         print(f"Error: {result.stderr}", file=sys.stderr)
@@ -63,6 +149,71 @@ def run_gh(*args: str, capture: bool = True, check: bool = True) -> str:
     return result.stdout.strip() if capture else ""
 
 
+def graphql(query: str, **variables) -> dict:
+    """
+    Execute GraphQL query with typed variables.
+
+    Goes over gh_http's keep-alive connection when a token is available,
+    otherwise through `gh api graphql` with the JSON body on stdin.
+    """
+    if gh_http.available():
+        try:
+            data = gh_http.graphql(query, variables)
+        except (OSError, http.client.HTTPException) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if data is None:
+            print("Error: GitHub API returned a non-JSON response", file=sys.stderr)
+            sys.exit(1)
+    else:
+        result = subprocess.run(
+            [gh_http.GH, "api", "graphql", "--input", "-"],
+            input=json.dumps({"query": query, "variables": variables}),
+            capture_output=True,
+            text=True,
+        )
+
+        # gh exits non-zero on GraphQL errors but still prints the response
+        try:
+            data = gh_http.loads(result.stdout)
+        except json.JSONDecodeError:
+            print(f"Error: {result.stderr}", file=sys.stderr)
+            sys.exit(1)
+
+    if "errors" in data:
+        print(f"GraphQL Error: {data['errors']}", file=sys.stderr)
+        sys.exit(1)
+
+    return data
+
+
+COMPLETION_CONTEXT_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      title
+      projectItems(first: 5) {
+        nodes {
+          id
+          project {
+            id
+            field(name: "Status") {
+              ... on ProjectV2SingleSelectField {
+                id
+                options { id, name }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+@lru_cache(maxsize=None)
+@disk_cached("{cwd}", ttl_seconds=ONE_HOUR)
 def get_repo() -> str:
     """Get current repo in owner/repo format."""
     return run_gh("repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner")
@@ -71,20 +222,18 @@ def get_repo() -> str:
 def slugify(text: str, max_length: int = 50) -> str:
     """Convert text to URL-friendly slug."""
     slug = text.lower()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug)
+    slug = _SLUG_STRIP.sub('', slug)
+    slug = _SLUG_SEPARATOR.sub('-', slug)
     slug = slug.strip('-')
     return slug[:max_length]
 
 
 def get_issue(number: int) -> dict:
     """Get full issue details as JSON."""
-    result = run_gh(
+    return gh_http.run_gh_json(
         "issue", "view", str(number),
         "--json", "number,title,body,state,labels,assignees,milestone,comments,projectItems,createdAt"
     )
-    return json.loads(result)
 
 
 def get_project_status(issue: dict) -> Optional[str]:
@@ -111,14 +260,20 @@ def list_issues(
     format_type: str = "table"
 ) -> list:
     """List issues, optionally filtered by project status or milestone."""
-    args = ["issue", "list", "--state", "open", "--json",
+    if status:
+        # Status lives on the board, so read the board rather than every open issue
+        status_lower = status.lower().replace("-", " ").replace("_", " ")
+        issues = list_project_issues([status_lower], milestone)
+        if issues is not None:
+            return issues
+
+    args = ["issue", "list", "--state", "open", "--limit", str(ISSUE_LIST_LIMIT), "--json",
             "number,title,state,labels,milestone,projectItems,createdAt"]
 
     if milestone:
         args.extend(["--milestone", milestone])
 
-    result = run_gh(*args)
-    issues = json.loads(result)
+    issues = gh_http.run_gh_json(*args)
 
     if status:
         status_lower = status.lower().replace("-", " ").replace("_", " ")
@@ -132,14 +287,105 @@ def list_issues(
     return issues
 
 
+def _normalize_issue(node: dict) -> dict:
+    """Reshape a GraphQL issue node into the `gh issue list --json` layout."""
+    return {
+        **node,
+        "labels": node["labels"]["nodes"],
+        "projectItems": [
+            {"status": item["fieldValueByName"]}
+            for item in node["projectItems"]["nodes"]
+            if item.get("fieldValueByName")
+        ],
+    }
+
+
+def list_open_issues_with_status() -> list[dict]:
+    """Fetch all open issues with their project board status in one paginated query."""
+    owner, name = get_repo().split("/", 1)
+    issues = []
+    cursor = None
+
+    while True:
+        result = graphql(OPEN_ISSUES_QUERY, owner=owner, name=name, cursor=cursor)
+        page = result["data"]["repository"]["issues"]
+        issues.extend(_normalize_issue(node) for node in page["nodes"])
+
+        if not page["pageInfo"]["hasNextPage"]:
+            return issues
+        cursor = page["pageInfo"]["endCursor"]
+
+
+def list_project_issues(statuses: list[str], milestone: Optional[str] = None) -> Optional[list]:
+    """
+    List open issues of this repo in the given board columns.
+
+    Walks the repository's project items instead of all open issues.
+
+    Args:
+        statuses: Lowercased Status names to keep
+        milestone: Optional milestone title to filter by
+
+    Returns:
+        Issues in `gh issue list --json` layout, or None if the repo has no project.
+    """
+    try:
+        from project_board import get_project_id_from_repo
+    except ImportError:
+        return None
+
+    project_id = get_project_id_from_repo()
+    if not project_id:
+        return None
+
+    repo = get_repo()
+    issues = []
+    cursor = None
+
+    while True:
+        result = graphql(PROJECT_ITEMS_QUERY, projectId=project_id, cursor=cursor)
+        page = result["data"]["node"]["items"]
+
+        for item in page["nodes"]:
+            issue = item.get("content") or {}
+            status = item.get("fieldValueByName")
+            if not issue.get("number") or issue["state"] != "OPEN" or not status:
+                continue
+            # Projects can hold issues from other repositories
+            if issue["repository"]["nameWithOwner"] != repo:
+                continue
+            if status["name"].lower() not in statuses:
+                continue
+            if milestone and (issue.get("milestone") or {}).get("title") != milestone:
+                continue
+
+            issue = {k: v for k, v in issue.items() if k != "repository"}
+            issues.append({
+                **issue,
+                "labels": issue["labels"]["nodes"],
+                "projectItems": [{"status": status}],
+            })
+
+        if not page["pageInfo"]["hasNextPage"]:
+            return issues
+        cursor = page["pageInfo"]["endCursor"]
+
+
 def pickup_issue(milestone: Optional[str] = None) -> Optional[dict]:
     """Find the next issue to work on based on priority."""
-    # Get all issues in pickup columns
-    all_issues = []
+    # One walk of the board covers every pickup column; without a project,
+    # fall back to scanning open issues
+    candidates = list_project_issues(PICKUP_COLUMNS, milestone)
+    if candidates is None:
+        candidates = [
+            issue for issue in list_open_issues_with_status()
+            if not milestone or (issue.get("milestone") or {}).get("title") == milestone
+        ]
 
-    for column in PICKUP_COLUMNS:
-        issues = list_issues(status=column, milestone=milestone)
-        for issue in issues:
+    all_issues = []
+    for issue in candidates:
+        column = get_project_status(issue)
+        if column in PICKUP_COLUMNS:
             issue["_pickup_column"] = column
             all_issues.append(issue)
 
@@ -187,7 +433,10 @@ def show_issue(number: int) -> None:
 
 def post_comment(number: int, body: str) -> None:
     """Post a comment to an issue."""
-    run_gh("issue", "comment", str(number), "--body", body, capture=False)
+    # Captured rather than passed through so a failure still reports gh's stderr
+    comment_url = run_gh("issue", "comment", str(number), "--body", body)
+    if comment_url:
+        print(comment_url)
     print(f"Comment posted to issue #{number}")
 
 
@@ -202,9 +451,49 @@ def create_pr(number: int, title: str, body: str) -> str:
     return result
 
 
+def _resolve_completion_context(number: int, target_status: str) -> dict:
+    """
+    Resolve the issue title and every ID needed to move it, in one query.
+
+    Returns:
+        Dict with "title" and, when the issue is on a board with a matching
+        Status option, "move" = (project_id, item_id, field_id, option_id).
+    """
+    owner, name = get_repo().split("/", 1)
+    result = graphql(COMPLETION_CONTEXT_QUERY, owner=owner, name=name, number=number)
+    issue = result["data"]["repository"]["issue"]
+
+    context = {"title": issue["title"], "move": None}
+    try:
+        from project_board import find_status_option
+    except ImportError:
+        return context
+
+    for item in issue["projectItems"]["nodes"]:
+        field = item["project"].get("field")
+        option_id = field and find_status_option(field.get("options", []), target_status)
+        if option_id:
+            context["move"] = (item["project"]["id"], item["id"], field["id"], option_id)
+            break
+    return context
+
+
+def _move_to_review(number: int, move: Optional[tuple]) -> None:
+    """Move issue to review, reusing IDs resolved up front when possible."""
+    try:
+        from project_board import move_issue, move_issue_by_ids
+        if move:
+            move_issue_by_ids(*move)
+            print(f"Moved issue #{number} to 'review'")
+        else:
+            move_issue(number, "review")
+    except ImportError:
+        print("Note: Run project_board.py move to move issue to Review column")
+
+
 def post_completion(number: int, summary: str, confidence: int, test_results: str) -> None:
     """Post a structured completion comment and create PR."""
-    issue = get_issue(number)
+    issue = _resolve_completion_context(number, "review")
     branch = f"issue/{number}-{slugify(issue['title'])}"
 
     # Create PR first
@@ -242,14 +531,93 @@ Closes #{number}
 - Branch: `{branch}`
 - PR: {pr_url}
 """
-    post_comment(number, comment_body)
+    # The board move doesn't depend on the comment, so it runs in the
+    # background while the comment is posted
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        move_future = executor.submit(_move_to_review, number, issue["move"])
+        post_comment(number, comment_body)
+
+        # Re-raises any failure (including sys.exit) from the move
+        move_future.result()
+
+
+def _fetch_image(url: str, filepath: Path, etag: Optional[str]) -> Optional[tuple[int, Optional[str]]]:
+    """
+    Conditionally GET an image with the gh token.
+
+    Returns:
+        (HTTP status, ETag) where 304 means the cached copy is current, or
+        None if this path can't be used (no token or a request error).
+    """
+    token = gh_http.get_gh_token()
+    if not token:
+        return None
+
+    request = urllib.request.Request(url)
+    # Not forwarded on redirect: the signed storage URL carries its own auth
+    request.add_unredirected_header("Authorization", f"token {token}")
+    if etag:
+        request.add_header("If-None-Match", etag)
 
-    # Move to review
     try:
-        from project_board import move_issue
-        move_issue(number, "review")
-    except ImportError:
-        print("Note: Run project_board.py move to move issue to Review column")
+        with urllib.request.urlopen(request, timeout=30) as response, filepath.open("wb") as f:
+            # Stream to disk in fixed-size chunks instead of holding the whole image
+            shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+            return response.status, response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, etag
+        return None
+    except (urllib.error.URLError, OSError):
+        return None
+
+
+def _download_image(url: str, filepath: Path, cached: Optional[dict] = None) -> tuple[bool, Optional[str]]:
+    """
+    Download one image, skipping the transfer when a cached copy is current.
+
+    Tries a conditional GET first, then gh api (handles auth) and curl.
+
+    Returns:
+        (success, ETag to remember or None)
+    """
+    # Image numbers shift when comments are added or removed, so the ETag is
+    # only sent when the file at this job's own path was saved from this URL
+    reusable = cached and cached["filename"] == filepath.name and filepath.exists()
+    etag = cached["etag"] if reusable else None
+
+    # Write to a temp file next to the target and only replace it on success,
+    # so a failed transfer never truncates an existing (possibly cached) copy
+    tmp_path = filepath.with_name(f".{filepath.name}.part")
+    try:
+        fetched = _fetch_image(url, tmp_path, etag)
+        if fetched:
+            status, new_etag = fetched
+            if status == 304:
+                return True, new_etag
+            os.replace(tmp_path, filepath)
+            return True, new_etag
+
+        with tmp_path.open("wb") as f:
+            result = subprocess.run(
+                [gh_http.GH, "api", "-H", "Accept: application/octet-stream", url],
+                stdout=f,
+                stderr=subprocess.DEVNULL,
+            )
+
+        if result.returncode != 0:
+            # Fallback to curl
+            result = subprocess.run(
+                ["curl", "-sL", "-o", str(tmp_path), url],
+                capture_output=True
+            )
+            if result.returncode != 0:
+                return False, None
+
+        os.replace(tmp_path, filepath)
+        return True, None
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def extract_images(number: int, output_dir: str) -> list[str]:
@@ -259,27 +627,25 @@ def extract_images(number: int, output_dir: str) -> list[str]:
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Collect all text content
-    all_text = issue.get('body', '') or ''
-    for comment in issue.get('comments', []):
-        all_text += '\n' + (comment.get('body', '') or '')
+    bodies = [issue.get('body', '') or '']
+    bodies.extend(comment.get('body', '') or '' for comment in issue.get('comments', []))
 
     # Find GitHub-hosted images
-    patterns = [
-        r'!\[.*?\]\((https://(?:user-images\.githubusercontent\.com|github\.com/user-attachments)[^\)]+)\)',
-        r'<img[^>]+src=["\']?(https://(?:user-images\.githubusercontent\.com|github\.com/user-attachments)[^"\'\s>]+)',
-    ]
-
     urls = []
-    for pattern in patterns:
-        urls.extend(re.findall(pattern, all_text))
+    for pattern in _IMG_PATTERNS:
+        for body in bodies:
+            urls.extend(pattern.findall(body))
 
     if not urls:
         print(f"No images found in issue #{number}")
         return []
 
+    # The same screenshot is often quoted in several comments
+    urls = list(dict.fromkeys(urls))
+
     print(f"Found {len(urls)} image(s) in issue #{number}")
-    downloaded = []
 
+    jobs = []
     for i, url in enumerate(urls, 1):
         # Determine extension from URL
         url_path = url.split('?')[0]
@@ -289,54 +655,73 @@ def extract_images(number: int, output_dir: str) -> list[str]:
             ext = '.png'
 
         filename = f"issue-{number}-image-{i}{ext}"
-        filepath = output_path / filename
+        jobs.append((url, output_path / filename))
 
-        # Use gh api to download (handles auth)
-        result = subprocess.run(
-            ["gh", "api", "-H", "Accept: application/octet-stream", url],
-            capture_output=True
-        )
+    # ETags from earlier runs into this directory let unchanged images skip the transfer
+    cache_file = output_path / ETAG_CACHE_FILE
+    try:
+        etag_cache = json.loads(cache_file.read_text())
+    except (OSError, json.JSONDecodeError):
+        etag_cache = {}
 
-        if result.returncode == 0:
-            filepath.write_bytes(result.stdout)
+    # Downloads are independent, so run them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda job: _download_image(job[0], job[1], etag_cache.get(job[0])), jobs
+        ))
+
+    downloaded = []
+    for (url, filepath), (ok, etag) in zip(jobs, results):
+        if ok:
             print(f"  Downloaded: {filepath}")
             downloaded.append(str(filepath))
-        else:
-            # Fallback to curl
-            result = subprocess.run(
-                ["curl", "-sL", "-o", str(filepath), url],
-                capture_output=True
-            )
-            if result.returncode == 0:
-                print(f"  Downloaded: {filepath}")
-                downloaded.append(str(filepath))
+            if etag:
+                etag_cache[url] = {"etag": etag, "filename": filepath.name}
             else:
-                print(f"  Failed to download: {url}", file=sys.stderr)
+                etag_cache.pop(url, None)
+        else:
+            print(f"  Failed to download: {url}", file=sys.stderr)
+
+    # A file rewritten for another URL no longer holds an older entry's image
+    written = {filepath.name: url for (url, filepath), (ok, _) in zip(jobs, results) if ok}
+    etag_cache = {
+        url: entry for url, entry in etag_cache.items()
+        if written.get(entry["filename"], url) == url
+    }
+
+    try:
+        cache_file.write_text(json.dumps(etag_cache, indent=2))
+    except OSError:
+        pass
 
     return downloaded
 
 
 def generate_report(milestone: Optional[str] = None) -> None:
     """Generate a status report of issues."""
-    args = ["issue", "list", "--state", "all", "--json",
-            "number,title,state,labels,milestone,projectItems,createdAt"]
+    # Only the fields the report prints or groups by
+    args = ["issue", "list", "--state", "all", "--limit", str(ISSUE_LIST_LIMIT), "--json",
+            "number,title,labels,projectItems"]
 
     if milestone:
         args.extend(["--milestone", milestone])
 
-    result = run_gh(*args)
-    issues = json.loads(result)
+    issues = gh_http.run_gh_json(*args)
 
-    # Group by status
-    by_status = defaultdict(list)
-    by_label = defaultdict(list)
+    # Count by status and priority in one pass; keep only the previewed issues
+    status_counts = Counter()
+    status_preview = defaultdict(list)
+    priority_counts = Counter()
+    priority_set = set(PRIORITY_ORDER)
 
     for issue in issues:
         status = get_project_status(issue) or "no status"
-        by_status[status].append(issue)
+        status_counts[status] += 1
+        if len(status_preview[status]) < 5:
+            status_preview[status].append(issue)
 
-        for label in issue.get("labels", []):
-            by_label[label["name"]].append(issue)
+        label_set = {l["name"] for l in issue.get("labels", [])}
+        priority_counts.update(label_set & priority_set)
 
     # Print report
     if milestone:
@@ -349,24 +734,29 @@ def generate_report(milestone: Optional[str] = None) -> None:
     print("### By Status")
     status_order = ["todo", "planning", "dev ready", "in progress", "review", "done", "no status"]
     for status in status_order:
-        if status in by_status:
-            print(f"\n**{status.title()}** ({len(by_status[status])})")
-            for issue in by_status[status][:5]:  # Show first 5
+        if status in status_counts:
+            print(f"\n**{status.title()}** ({status_counts[status]})")
+            for issue in status_preview[status]:  # Show first 5
                 labels = ", ".join(l["name"] for l in issue.get("labels", []))
                 label_str = f" [{labels}]" if labels else ""
                 print(f"  - #{issue['number']}: {issue['title']}{label_str}")
-            if len(by_status[status]) > 5:
-                print(f"  ... and {len(by_status[status]) - 5} more")
+            if status_counts[status] > 5:
+                print(f"  ... and {status_counts[status] - 5} more")
 
     # Show priority distribution
     print("\n### By Priority")
     for priority in PRIORITY_ORDER:
-        if priority in by_label:
-            print(f"- **{priority}**: {len(by_label[priority])} issues")
+        if priority in priority_counts:
+            print(f"- **{priority}**: {priority_counts[priority]} issues")
 
 
 def main():
     parser = argparse.ArgumentParser(description="GitHub dev workflow CLI")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached repository/project lookups and refetch them",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # list
@@ -408,6 +798,8 @@ def main():
 
     args = parser.parse_args()
 
+    disk_cache.set_refresh(args.refresh)
+
     if args.command == "list":
         issues = list_issues(args.status, args.milestone)
         if args.format == "json":
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Keep-alive HTTPS client for the GitHub API.
+
+Every `gh api` call starts a new gh process that re-reads its config and opens
+a fresh TLS connection. This module resolves the token once with
+`gh auth token` and sends REST and GraphQL requests over one persistent
+connection per thread.
+
+Callers should check `available()` and fall back to the gh CLI when no token
+can be resolved (gh not logged in, or a GitHub Enterprise host).
+
+Usage:
+    import gh_http
+
+    if gh_http.available():
+        status, data = gh_http.request("GET", "repos/owner/repo")
+        response = gh_http.graphql("query { viewer { login } }")
+
+    # gh CLI commands with JSON output (e.g. `gh issue list --json`)
+    issues = gh_http.run_gh_json("issue", "list", "--json", "number")
+"""
+
+import http.client
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+API_HOST = "api.github.com"
+
+# gh resolved against PATH once, instead of on every exec
+GH = shutil.which("gh") or "gh"
+
+_DEFAULT_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "gh-dev-flow",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+# Token is resolved once per process; False means "looked up, none available"
+_token: str | None | bool = None
+_token_lock = threading.Lock()
+
+# A reset or broken pipe can arrive after the server handled the request, so
+# only these methods are resent after one
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+# One keep-alive connection per thread (http.client connections aren't thread-safe)
+_local = threading.local()
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON response, using orjson when it is installed.
+
+    orjson parses bytes directly, so response bodies skip the UTF-8 decode.
+    Its JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the same exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def run_gh_json(*args: str) -> Any:
+    """
+    Run gh CLI command and parse its JSON output, exiting on failure.
+
+    Shared by the CLI scripts for commands without a direct API equivalent.
+
+    Output is captured as bytes and handed to loads (orjson when installed),
+    skipping the text decode and the stripped copy. Both pipes are drained
+    together, so a chatty stderr can't fill its pipe and stall gh.
+    """
+    result = subprocess.run([GH] + list(args), capture_output=True)
+    try:
+        data = loads(result.stdout)
+    except json.JSONDecodeError:
+        data = None
+
+    if result.returncode != 0 or data is None:
+        print(f"Error: {result.stderr.decode(errors='replace')}", file=sys.stderr)
+        sys.exit(1)
+    return data
+
+
+def get_gh_token() -> str | None:
+    """Get GitHub token from gh CLI (resolved once per process)."""
+    global _token
+    with _token_lock:
+        if _token is None:
+            host = os.environ.get("GH_HOST", "github.com")
+            if host != "github.com":
+                _token = False
+            else:
+                try:
+                    result = subprocess.run(
+                        [GH, "auth", "token"],
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    )
+                    _token = result.stdout.strip() or False
+                except (subprocess.CalledProcessError, OSError):
+                    _token = False
+        return _token or None
+
+
+def available() -> bool:
+    """Whether direct API access is possible (a token was resolved)."""
+    return get_gh_token() is not None
+
+
+def _connection() -> http.client.HTTPSConnection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection(API_HOST, timeout=30)
+        _local.conn = conn
+        _local.used = False
+    return conn
+
+
+def _reset_connection() -> None:
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    _local.conn = None
+
+
+def _send(
+    method: str,
+    path: str,
+    payload: Any = None,
+    headers: dict[str, str] | None = None,
+) -> tuple[http.client.HTTPResponse, Any]:
+    """Send a request and return the (already read) response and parsed body."""
+    token = get_gh_token()
+    if not token:
+        raise RuntimeError("No GitHub token available; use the gh CLI instead")
+
+    body = json.dumps(payload).encode("utf-8") if payload is not None else None
+    all_headers = {**_DEFAULT_HEADERS, "Authorization": f"Bearer {token}", **(headers or {})}
+    if body is not None:
+        all_headers["Content-Type"] = "application/json"
+
+    url = "/" + path.lstrip("/")
+
+    while True:
+        conn = _connection()
+        reused = _local.used
+        try:
+            conn.request(method, url, body=body, headers=all_headers)
+            response = conn.getresponse()
+            data = response.read()
+            _local.used = True
+            break
+        except (BrokenPipeError, ConnectionResetError) as e:
+            # RemoteDisconnected (a ConnectionResetError) means the server closed
+            # an idle keep-alive connection without answering, which is safe to
+            # resend even for mutations; reconnect and retry once
+            _reset_connection()
+            if not reused:
+                raise
+            if not isinstance(e, http.client.RemoteDisconnected) and method not in IDEMPOTENT_METHODS:
+                raise
+        except Exception:
+            # e.g. a timeout mid-response leaves the connection unusable
+            _reset_connection()
+            raise
+
+    try:
+        parsed = loads(data) if data else None
+    except json.JSONDecodeError:
+        parsed = None
+    return response, parsed
+
+
+def request(
+    method: str,
+    path: str,
+    payload: Any = None,
+    headers: dict[str, str] | None = None,
+) -> tuple[int, Any]:
+    """
+    Send a REST request over the persistent connection.
+
+    Args:
+        method: HTTP method
+        path: API path like "repos/owner/repo" (leading slash optional)
+        payload: JSON-serializable request body
+        headers: Extra request headers
+
+    Returns:
+        Tuple of (HTTP status, parsed JSON body or None).
+
+    Raises:
+        OSError / http.client.HTTPException on network failure.
+    """
+    response, parsed = _send(method, path, payload, headers)
+    return response.status, parsed
+
+
+def get_conditional(path: str, etag: str | None = None) -> tuple[int, Any, str | None]:
+    """
+    GET a REST resource, revalidating a previously seen ETag.
+
+    A 304 response has no body and doesn't count against the rate limit.
+
+    Returns:
+        Tuple of (HTTP status, parsed JSON body or None, response ETag).
+    """
+    headers = {"If-None-Match": etag} if etag else None
+    response, parsed = _send("GET", path, headers=headers)
+    return response.status, parsed, response.getheader("ETag") or etag
+
+
+def graphql(
+    query: str,
+    variables: dict | None = None,
+    headers: dict[str, str] | None = None,
+) -> dict | None:
+    """
+    Execute a GraphQL request.
+
+    Returns:
+        Parsed response (which may contain "errors"), or None if the body isn't JSON.
+    """
+    status, data = request("POST", "graphql", {"query": query, "variables": variables or {}}, headers)
+    if not isinstance(data, dict):
+        return None
+    if status != 200:
+        # e.g. 401 {"message": "Bad credentials"}; surface it like a GraphQL error
+        return {"errors": [{"message": data.get("message", f"HTTP {status}")}]}
+    return data
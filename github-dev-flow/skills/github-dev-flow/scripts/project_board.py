@@ -9,6 +9,9 @@ Usage:
     project_board.py move 42 --to planning
     project_board.py move 42 --to "ready for dev"
 
+    # Move several issues at once
+    project_board.py move 42 43 44 --to done
+
     # List project columns/statuses
     project_board.py columns
 
@@ -17,15 +20,21 @@ Environment:
 """
 
 import argparse
+import http.client
 import json
 import subprocess
 import sys
+from functools import lru_cache
 from typing import Optional
 
+import disk_cache
+import gh_http
+from disk_cache import ONE_HOUR, disk_cached
+
 
 def run_gh(*args: str, check: bool = True) -> str:
     """Run gh CLI command."""
-    cmd = ["gh"] + list(args)
+    cmd = [gh_http.GH] + list(args)
     result = subprocess.run(cmd, capture_output=True, text=True)
     if check and result.returncode != 0:
         print(f"Error: {result.stderr}", file=sys.stderr)
@@ -34,13 +43,36 @@ def run_gh(*args: str, check: bool = True) -> str:
 
 
 def graphql(query: str, **variables) -> dict:
-    """Execute GraphQL query via gh api."""
-    args = ["api", "graphql", "-f", f"query={query}"]
-    for key, value in variables.items():
-        args.extend(["-f", f"{key}={value}"])
+    """
+    Execute GraphQL query with typed variables.
 
-    result = run_gh(*args)
-    data = json.loads(result)
+    Goes over gh_http's keep-alive connection when a token is available,
+    otherwise through `gh api graphql` with the JSON body on stdin.
+    """
+    if gh_http.available():
+        try:
+            data = gh_http.graphql(query, variables)
+        except (OSError, http.client.HTTPException) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if data is None:
+            print("Error: GitHub API returned a non-JSON response", file=sys.stderr)
+            sys.exit(1)
+    else:
+        # Send the JSON body over stdin so variables keep their types (ints, lists)
+        result = subprocess.run(
+            [gh_http.GH, "api", "graphql", "--input", "-"],
+            input=json.dumps({"query": query, "variables": variables}),
+            capture_output=True,
+            text=True,
+        )
+
+        # gh exits non-zero on GraphQL errors but still prints the response
+        try:
+            data = gh_http.loads(result.stdout)
+        except json.JSONDecodeError:
+            print(f"Error: {result.stderr}", file=sys.stderr)
+            sys.exit(1)
 
     if "errors" in data:
         print(f"GraphQL Error: {data['errors']}", file=sys.stderr)
@@ -49,29 +81,60 @@ def graphql(query: str, **variables) -> dict:
     return data
 
 
+@lru_cache(maxsize=None)
+@disk_cached("{cwd}", ttl_seconds=ONE_HOUR)
 def get_repo_info() -> tuple[str, str]:
     """Get repository owner and name."""
-    result = run_gh("repo", "view", "--json", "owner,name")
-    data = json.loads(result)
+    data = gh_http.run_gh_json("repo", "view", "--json", "owner,name")
     return data["owner"]["login"], data["name"]
 
 
-def find_project_for_issue(number: int) -> Optional[dict]:
-    """Find the project containing this issue and return project/item info."""
-    result = run_gh(
-        "issue", "view", str(number),
-        "--json", "projectItems"
+def find_project_items(numbers: list[int]) -> dict[int, dict]:
+    """
+    Look up several issues and their project items in one aliased query.
+
+    Returns:
+        {number: {"id": issue node ID, "item": first project item or None}}
+    """
+    owner, repo = get_repo_info()
+
+    params = ["$owner: String!", "$repo: String!"]
+    selections = []
+    variables = {"owner": owner, "repo": repo}
+    for i, number in enumerate(numbers):
+        params.append(f"$number{i}: Int!")
+        selections.append(
+            f"i{i}: issue(number: $number{i}) {{ id projectItems(first: 5) {{ nodes {{ id project {{ id }} }} }} }}"
+        )
+        variables[f"number{i}"] = number
+
+    query = (
+        f"query({', '.join(params)}) {{\n"
+        f"  repository(owner: $owner, name: $repo) {{\n    "
+        + "\n    ".join(selections)
+        + "\n  }\n}"
     )
-    data = json.loads(result)
+    result = graphql(query, **variables)
+    repository = result["data"]["repository"]
+
+    issues = {}
+    for i, number in enumerate(numbers):
+        issue = repository.get(f"i{i}")
+        if not issue:
+            print(f"Issue #{number} not found", file=sys.stderr)
+            sys.exit(1)
+        items = issue["projectItems"]["nodes"]
+        issues[number] = {"id": issue["id"], "item": items[0] if items else None}
+    return issues
 
-    items = data.get("projectItems", [])
-    if not items:
-        return None
 
-    # Return first project item with full info
-    return items[0]
+def find_project_for_issue(number: int) -> Optional[dict]:
+    """Find the project containing this issue and return project/item info."""
+    return find_project_items([number])[number]["item"]
 
 
+@lru_cache(maxsize=None)
+@disk_cached("{cwd}", ttl_seconds=ONE_HOUR)
 def get_project_id_from_repo() -> Optional[str]:
     """Get first project linked to the repository."""
     owner, repo = get_repo_info()
@@ -97,6 +160,7 @@ def get_project_id_from_repo() -> Optional[str]:
     return projects[0]["id"]
 
 
+@lru_cache(maxsize=None)
 def get_project_fields(project_id: str) -> list[dict]:
     """Get project fields including Status options."""
     query = """
@@ -127,6 +191,8 @@ def get_project_fields(project_id: str) -> list[dict]:
     return result["data"]["node"]["fields"]["nodes"]
 
 
+@lru_cache(maxsize=None)
+@disk_cached("{0}", ttl_seconds=ONE_HOUR)
 def get_status_field(project_id: str) -> tuple[str, list[dict]]:
     """Get the Status field ID and its options."""
     fields = get_project_fields(project_id)
@@ -140,97 +206,123 @@ def get_status_field(project_id: str) -> tuple[str, list[dict]]:
 
 def add_issue_to_project(project_id: str, issue_number: int) -> str:
     """Add issue to project and return the item ID."""
-    owner, repo = get_repo_info()
+    issue_id = find_project_items([issue_number])[issue_number]["id"]
+    return add_issues_to_project(project_id, [issue_id])[0]
 
-    # Get issue node ID
-    result = run_gh("issue", "view", str(issue_number), "--json", "id")
-    issue_data = json.loads(result)
-    issue_id = issue_data["id"]
-
-    # Add to project
-    mutation = """
-    mutation($projectId: ID!, $contentId: ID!) {
-      addProjectV2ItemById(input: {
-        projectId: $projectId
-        contentId: $contentId
-      }) {
-        item {
-          id
-        }
-      }
-    }
+
+def add_issues_to_project(project_id: str, content_ids: list[str]) -> list[str]:
+    """Add several issues (by node ID) to a project in one mutation; return item IDs."""
+    params = ["$projectId: ID!"]
+    selections = []
+    variables = {"projectId": project_id}
+    for i, content_id in enumerate(content_ids):
+        params.append(f"$content{i}: ID!")
+        selections.append(
+            f"a{i}: addProjectV2ItemById(input: {{ projectId: $projectId, contentId: $content{i} }}) {{ item {{ id }} }}"
+        )
+        variables[f"content{i}"] = content_id
+
+    mutation = f"mutation({', '.join(params)}) {{\n  " + "\n  ".join(selections) + "\n}"
+    result = graphql(mutation, **variables)
+    return [result["data"][f"a{i}"]["item"]["id"] for i in range(len(content_ids))]
+
+
+def find_status_option(options: list[dict], target_status: str) -> Optional[str]:
+    """Match a status name to an option ID (case-insensitive, normalize spaces)."""
+    target_lower = target_status.lower().replace("-", " ").replace("_", " ")
+    for opt in options:
+        opt_name = opt["name"].lower().replace("-", " ").replace("_", " ")
+        if opt_name == target_lower:
+            return opt["id"]
+    return None
+
+
+def update_item_statuses(updates: list[tuple[str, str, str, str]]) -> None:
     """
-    result = graphql(mutation, projectId=project_id, contentId=issue_id)
-    return result["data"]["addProjectV2ItemById"]["item"]["id"]
+    Set the Status of several project items in one aliased mutation.
 
+    Args:
+        updates: (project_id, item_id, field_id, option_id) per item
+    """
+    params = []
+    selections = []
+    variables = {}
+    for i, (project_id, item_id, field_id, option_id) in enumerate(updates):
+        params.extend([f"$project{i}: ID!", f"$item{i}: ID!", f"$field{i}: ID!", f"$option{i}: String!"])
+        selections.append(
+            f"m{i}: updateProjectV2ItemFieldValue(input: {{ projectId: $project{i}, itemId: $item{i}, "
+            f"fieldId: $field{i}, value: {{ singleSelectOptionId: $option{i} }} }}) {{ projectV2Item {{ id }} }}"
+        )
+        variables.update({
+            f"project{i}": project_id,
+            f"item{i}": item_id,
+            f"field{i}": field_id,
+            f"option{i}": option_id,
+        })
+
+    mutation = f"mutation({', '.join(params)}) {{\n  " + "\n  ".join(selections) + "\n}"
+    graphql(mutation, **variables)
+
+
+def move_issue_by_ids(project_id: str, item_id: str, field_id: str, option_id: str) -> None:
+    """Set a project item's Status when all IDs are already resolved."""
+    update_item_statuses([(project_id, item_id, field_id, option_id)])
+
+
+def move_issues(numbers: list[int], target_status: str) -> None:
+    """
+    Move several issues to a project board column.
 
-def move_issue(number: int, target_status: str) -> None:
-    """Move issue to a different project board column."""
-    # Find project item
-    item = find_project_for_issue(number)
+    Lookups, adds for issues not yet on the board, and the Status updates
+    each go out as one batched GraphQL request.
+    """
+    numbers = list(dict.fromkeys(numbers))
+    issues = find_project_items(numbers)
 
-    if not item:
-        # Issue not in any project, try to add it
+    unlisted = [n for n in numbers if not issues[n]["item"]]
+    if unlisted:
+        # Issues not in any project, try to add them
         project_id = get_project_id_from_repo()
         if not project_id:
-            print(f"Issue #{number} is not in any project and no project found for repo", file=sys.stderr)
+            names = ", ".join(f"#{n}" for n in unlisted)
+            print(f"Issue(s) {names} not in any project and no project found for repo", file=sys.stderr)
             sys.exit(1)
 
-        print(f"Adding issue #{number} to project...")
-        item_id = add_issue_to_project(project_id, number)
-    else:
+        for n in unlisted:
+            print(f"Adding issue #{n} to project...")
+        item_ids = add_issues_to_project(project_id, [issues[n]["id"] for n in unlisted])
+        for n, item_id in zip(unlisted, item_ids):
+            issues[n]["item"] = {"id": item_id, "project": {"id": project_id}}
+
+    updates = []
+    for n in numbers:
+        item = issues[n]["item"]
         project_id = item.get("project", {}).get("id")
         item_id = item.get("id")
+        if not project_id or not item_id:
+            print(f"Could not find project or item ID for issue #{n}", file=sys.stderr)
+            sys.exit(1)
 
-    if not project_id or not item_id:
-        print(f"Could not find project or item ID for issue #{number}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get status field and options
-    field_id, options = get_status_field(project_id)
+        # Get status field and options (cached per project)
+        field_id, options = get_status_field(project_id)
 
-    # Find matching option (case-insensitive, normalize spaces)
-    target_lower = target_status.lower().replace("-", " ").replace("_", " ")
-    option_id = None
+        option_id = find_status_option(options, target_status)
+        if not option_id:
+            available = ", ".join(f'"{opt["name"]}"' for opt in options)
+            print(f"Status '{target_status}' not found. Available: {available}", file=sys.stderr)
+            sys.exit(1)
 
-    for opt in options:
-        opt_name = opt["name"].lower().replace("-", " ").replace("_", " ")
-        if opt_name == target_lower:
-            option_id = opt["id"]
-            break
+        updates.append((project_id, item_id, field_id, option_id))
 
-    if not option_id:
-        available = ", ".join(f'"{opt["name"]}"' for opt in options)
-        print(f"Status '{target_status}' not found. Available: {available}", file=sys.stderr)
-        sys.exit(1)
+    update_item_statuses(updates)
 
-    # Update the item
-    mutation = """
-    mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $optionId: String!) {
-      updateProjectV2ItemFieldValue(
-        input: {
-          projectId: $projectId
-          itemId: $itemId
-          fieldId: $fieldId
-          value: { singleSelectOptionId: $optionId }
-        }
-      ) {
-        projectV2Item {
-          id
-        }
-      }
-    }
-    """
+    for n in numbers:
+        print(f"Moved issue #{n} to '{target_status}'")
 
-    graphql(
-        mutation,
-        projectId=project_id,
-        itemId=item_id,
-        fieldId=field_id,
-        optionId=option_id
-    )
 
-    print(f"Moved issue #{number} to '{target_status}'")
+def move_issue(number: int, target_status: str) -> None:
+    """Move issue to a different project board column."""
+    move_issues([number], target_status)
 
 
 def list_columns() -> None:
@@ -263,11 +355,16 @@ def list_columns() -> None:
 
 def main():
     parser = argparse.ArgumentParser(description="GitHub Projects V2 board operations")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached repository/project lookups and refetch them",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # move
     move_p = subparsers.add_parser("move", help="Move issue to column")
-    move_p.add_argument("number", type=int, help="Issue number")
+    move_p.add_argument("numbers", type=int, nargs="+", help="Issue number(s)")
     move_p.add_argument("--to", required=True, help="Target status/column")
 
     # columns
@@ -275,8 +372,10 @@ def main():
 
     args = parser.parse_args()
 
+    disk_cache.set_refresh(args.refresh)
+
     if args.command == "move":
-        move_issue(args.number, args.to)
+        move_issues(args.numbers, args.to)
 
     elif args.command == "columns":
         list_columns()
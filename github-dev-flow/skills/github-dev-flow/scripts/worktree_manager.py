@@ -24,17 +24,26 @@ Dependencies:
 """
 
 import argparse
+import importlib.util
 import os
 import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import gh_http
+
 
 # Path to shared git-worktree skill
 GIT_WORKTREE_SKILL = Path.home() / ".claude" / "skills" / "git-worktree" / "scripts" / "worktree_manager.py"
 
+# Patterns for slugify, compiled once
+_SLUG_STRIP = re.compile(r'[^a-z0-9\s-]')
+# Underscores are already stripped, so any run of whitespace/dashes becomes one dash
+_SLUG_SEPARATOR = re.compile(r'[\s-]+')
+
 
 def run_cmd(cmd: list[str], capture: bool = True, check: bool = True, cwd: Optional[Path] = None) -> str:
     """Run a shell command."""
@@ -51,14 +60,16 @@ def run_git(*args: str, cwd: Optional[Path] = None) -> str:
 
 def run_gh(*args: str) -> str:
     """Run gh command."""
-    return run_cmd(["gh"] + list(args))
+    return run_cmd([gh_http.GH] + list(args))
 
 
+@lru_cache(maxsize=1)
 def get_repo_root() -> Path:
     """Get git repository root."""
     return Path(run_git("rev-parse", "--show-toplevel"))
 
 
+@lru_cache(maxsize=1)
 def get_repo_name() -> str:
     """Get repository name."""
     return get_repo_root().name
@@ -67,26 +78,100 @@ def get_repo_name() -> str:
 def slugify(text: str, max_length: int = 50) -> str:
     """Convert text to URL-friendly slug."""
     slug = text.lower()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug)
+    slug = _SLUG_STRIP.sub('', slug)
+    slug = _SLUG_SEPARATOR.sub('-', slug)
     slug = slug.strip('-')
     return slug[:max_length]
 
 
+@lru_cache(maxsize=None)
 def get_issue_title(number: int) -> str:
     """Get issue title from GitHub."""
     result = run_gh("issue", "view", str(number), "--json", "title", "-q", ".title")
     return result
 
 
+def find_local_branch(number: int) -> Optional[str]:
+    """Find an existing local issue/<number>-<slug> branch."""
+    prefix = f"issue/{number}-"
+    output = run_git("for-each-ref", "--format=%(refname:short)", "refs/heads/issue/")
+    for ref in output.splitlines():
+        if ref.startswith(prefix):
+            return ref
+    return None
+
+
 def branch_name_for_issue(number: int) -> str:
-    """Generate branch name for issue."""
+    """Generate branch name for issue, reusing an existing local branch if present."""
+    existing = find_local_branch(number)
+    if existing:
+        return existing
+
     title = get_issue_title(number)
     slug = slugify(title)
     return f"issue/{number}-{slug}"
 
 
+def find_worktree_branch(number: int) -> Optional[str]:
+    """Find the branch of an existing worktree for an issue, without asking GitHub."""
+    # git filters to this issue's branches, so no other worktree is listed or parsed;
+    # %(worktreepath) is empty for branches that aren't checked out in a worktree
+    output = run_git(
+        "for-each-ref",
+        "--format=%(worktreepath)%00%(refname:short)",
+        f"refs/heads/issue/{number}-*",
+    )
+    for line in output.splitlines():
+        worktree, _, branch = line.partition("\0")
+        if worktree:
+            return branch
+    return None
+
+
+_git_worktree_module = None
+
+
+def _load_git_worktree_skill():
+    """Import the git-worktree skill script once, or return None if it can't be imported."""
+    global _git_worktree_module
+    if _git_worktree_module is None:
+        try:
+            spec = importlib.util.spec_from_file_location("git_worktree_skill", GIT_WORKTREE_SKILL)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _git_worktree_module = module if hasattr(module, "main") else False
+        except Exception:
+            # e.g. the skill declares dependencies that only `uv run` installs
+            _git_worktree_module = False
+    return _git_worktree_module or None
+
+
+def run_git_worktree_skill(*args: str) -> None:
+    """
+    Run a git-worktree skill command.
+
+    Calls the skill's main() in-process to skip the `uv run` + Python startup,
+    falling back to a subprocess when the script can't be imported.
+
+    Raises:
+        subprocess.CalledProcessError if the command fails.
+    """
+    module = _load_git_worktree_skill()
+    if module is None:
+        subprocess.run(["uv", "run", "python", str(GIT_WORKTREE_SKILL), *args], check=True)
+        return
+
+    saved_argv = sys.argv
+    sys.argv = [str(GIT_WORKTREE_SKILL), *args]
+    try:
+        module.main()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise subprocess.CalledProcessError(e.code if isinstance(e.code, int) else 1, sys.argv)
+    finally:
+        sys.argv = saved_argv
+
+
 def check_git_worktree_skill() -> bool:
     """Check if git-worktree skill is installed."""
     if not GIT_WORKTREE_SKILL.exists():
@@ -117,11 +202,11 @@ def create_worktree(number: int, path: Optional[str] = None) -> tuple[str, Path]
         worktree_path = Path(path).resolve()
 
     # Delegate to shared git-worktree skill
-    cmd = ["uv", "run", "python", str(GIT_WORKTREE_SKILL), "create", branch]
+    args = ["create", branch]
     if path:
-        cmd.extend(["--path", path])
+        args.extend(["--path", path])
 
-    subprocess.run(cmd, check=True)
+    run_git_worktree_skill(*args)
 
     return branch, worktree_path
 
@@ -131,7 +216,7 @@ def list_worktrees() -> None:
     if not check_git_worktree_skill():
         sys.exit(1)
 
-    subprocess.run(["uv", "run", "python", str(GIT_WORKTREE_SKILL), "list"], check=True)
+    run_git_worktree_skill("list")
 
 
 def remove_worktree(number: int) -> None:
@@ -139,13 +224,13 @@ def remove_worktree(number: int) -> None:
     if not check_git_worktree_skill():
         sys.exit(1)
 
-    # Generate branch name from issue
-    branch = branch_name_for_issue(number)
+    # Reuse the existing worktree's branch; only ask GitHub if there is none
+    branch = find_worktree_branch(number) or branch_name_for_issue(number)
     print(f"Removing worktree for issue #{number}")
     print(f"Branch: {branch}")
 
     # Delegate to shared git-worktree skill
-    subprocess.run(["uv", "run", "python", str(GIT_WORKTREE_SKILL), "remove", branch], check=True)
+    run_git_worktree_skill("remove", branch)
 
 
 def main():
@@ -13,6 +13,7 @@ Environment Variables (in priority order):
 
     Optional:
         LINEAR_TEAM_KEY: Team key like "ASA", defaults to first team
+        LINEAR_DEV_FLOW_NOCACHE: Set to 1 to skip the on-disk team cache
 
 Authentication Methods:
     1. Pre-generated token: Set LINEAR_OAUTH_ACCESS_TOKEN directly
@@ -22,40 +23,120 @@ Authentication Methods:
     3. Personal API key: Set LINEAR_API_KEY (posts as your user)
 """
 
+import functools
+import hashlib
+import http.client
 import json
 import os
 import sys
-import urllib.request
-import urllib.error
-import urllib.parse
-from typing import Any, Optional
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-LINEAR_API_URL = "https://api.linear.app/graphql"
+
+LINEAR_API_HOST = "api.linear.app"
+LINEAR_API_URL = f"https://{LINEAR_API_HOST}/graphql"
 LINEAR_TOKEN_URL = "https://api.linear.app/oauth/token"
 
+
+class LinearAPIError(Exception):
+    """A Linear API call failed; the message is ready to show the user."""
+
+
 # Module-level cache for client credentials token
 _cached_token: Optional[str] = None
 
+# Client credentials tokens last 30 days, so they're also reused across invocations
+TOKEN_CACHE_FILE = Path.home() / ".cache" / "linear-dev-flow" / "token.json"
+TOKEN_DEFAULT_LIFETIME = 30 * 24 * 60 * 60
+TOKEN_EXPIRY_MARGIN = 60
+
+# Teams and workflow states only change when an admin edits them
+WORKFLOW_CACHE_SECONDS = 5 * 60
+
+# Resolved teams are also persisted per credential; set LINEAR_DEV_FLOW_NOCACHE=1 to bypass
+TEAM_CACHE_DIR = Path.home() / ".cache" / "linear-dev-flow"
+TEAM_CACHE_SECONDS = 24 * 60 * 60
+
+# Rate-limited / unavailable responses weren't processed, so even mutations are safe to resend
+GRAPHQL_RETRY_STATUSES = frozenset({429, 503})
+GRAPHQL_RETRIES = 3
+GRAPHQL_RETRY_BACKOFF = 0.3
+
+# One keep-alive connection per thread (http.client connections aren't thread-safe)
+_local = threading.local()
+
+
+def _read_cached_token(client_id: str) -> Optional[str]:
+    """Return the persisted token for client_id if it hasn't (nearly) expired."""
+    try:
+        cached = json.loads(TOKEN_CACHE_FILE.read_text())
+        if cached["client_id"] == client_id and cached["expires_at"] > time.time() + TOKEN_EXPIRY_MARGIN:
+            return cached["access_token"]
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_cached_token(client_id: str, access_token: str, expires_in: int) -> None:
+    """Persist a token readable only by the current user. Failures are ignored."""
+    entry = {
+        "client_id": client_id,
+        "access_token": access_token,
+        "expires_at": time.time() + expires_in,
+    }
+    try:
+        TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TOKEN_CACHE_FILE, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+    except OSError:
+        pass
+
+
+def _clear_cached_token() -> None:
+    """Forget the persisted token (e.g. after it was rejected)."""
+    global _cached_token
+    _cached_token = None
+    try:
+        TOKEN_CACHE_FILE.unlink()
+    except OSError:
+        pass
+
 
 def _exchange_client_credentials() -> str:
     """
     Exchange OAuth client credentials for an access token.
 
-    Uses the Client Credentials grant type to obtain a 30-day app token.
+    Uses the Client Credentials grant type to obtain a 30-day app token,
+    reusing a token persisted by an earlier invocation while it is valid.
 
     Returns:
         Access token string.
 
     Raises:
-        SystemExit on failure.
+        LinearAPIError on failure.
     """
     client_id = os.environ.get("LINEAR_OAUTH_CLIENT_ID")
     client_secret = os.environ.get("LINEAR_OAUTH_CLIENT_SECRET")
 
     if not client_id or not client_secret:
-        print("Error: Both LINEAR_OAUTH_CLIENT_ID and LINEAR_OAUTH_CLIENT_SECRET required", file=sys.stderr)
-        sys.exit(1)
+        raise LinearAPIError("Error: Both LINEAR_OAUTH_CLIENT_ID and LINEAR_OAUTH_CLIENT_SECRET required")
+
+    cached = _read_cached_token(client_id)
+    if cached:
+        return cached
+
+    # Only needed for the (rare) token exchange, so imported here
+    import urllib.error
+    import urllib.parse
+    import urllib.request
 
     # Request body for client credentials grant
     # Using broad scopes - Linear will limit to what the app has access to
@@ -80,16 +161,14 @@ def _exchange_client_credentials() -> str:
             result = json.loads(response.read().decode("utf-8"))
     except urllib.error.HTTPError as e:
         error_body = e.read().decode("utf-8") if e.fp else str(e)
-        print(f"OAuth token exchange failed (HTTP {e.code}): {error_body}", file=sys.stderr)
-        sys.exit(1)
+        raise LinearAPIError(f"OAuth token exchange failed (HTTP {e.code}): {error_body}")
     except urllib.error.URLError as e:
-        print(f"Network Error during token exchange: {e.reason}", file=sys.stderr)
-        sys.exit(1)
+        raise LinearAPIError(f"Network Error during token exchange: {e.reason}")
 
     if "access_token" not in result:
-        print(f"OAuth response missing access_token: {result}", file=sys.stderr)
-        sys.exit(1)
+        raise LinearAPIError(f"OAuth response missing access_token: {result}")
 
+    _write_cached_token(client_id, result["access_token"], result.get("expires_in", TOKEN_DEFAULT_LIFETIME))
     return result["access_token"]
 
 
@@ -129,14 +208,15 @@ def get_auth_token() -> str:
         return api_key
 
     # No credentials found
-    print("Error: No Linear authentication configured", file=sys.stderr)
-    print("Set one of the following:", file=sys.stderr)
-    print("  LINEAR_OAUTH_ACCESS_TOKEN - Pre-generated OAuth token", file=sys.stderr)
-    print("  LINEAR_OAUTH_CLIENT_ID + LINEAR_OAUTH_CLIENT_SECRET - Client Credentials", file=sys.stderr)
-    print("  LINEAR_API_KEY - Personal API key (lin_api_*)", file=sys.stderr)
-    print("", file=sys.stderr)
-    print("Get credentials from: Linear Settings → API", file=sys.stderr)
-    sys.exit(1)
+    raise LinearAPIError(
+        "Error: No Linear authentication configured\n"
+        "Set one of the following:\n"
+        "  LINEAR_OAUTH_ACCESS_TOKEN - Pre-generated OAuth token\n"
+        "  LINEAR_OAUTH_CLIENT_ID + LINEAR_OAUTH_CLIENT_SECRET - Client Credentials\n"
+        "  LINEAR_API_KEY - Personal API key (lin_api_*)\n"
+        "\n"
+        "Get credentials from: Linear Settings → API"
+    )
 
 
 def get_auth_method() -> str:
@@ -158,51 +238,130 @@ def get_auth_method() -> str:
     return "none"
 
 
-# Backward compatibility alias
+# Backward compatibility alias; the token doesn't change within a process
+@functools.cache
 def get_api_key() -> str:
     """Deprecated: Use get_auth_token() instead."""
     return get_auth_token()
 
 
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _reset_connection() -> None:
+    """Close this thread's connection so the next request opens a fresh one."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    _local.conn = None
+
+
+def _post_graphql(body: bytes, headers: dict[str, str]) -> tuple[int, bytes]:
+    """
+    POST to the GraphQL endpoint over this thread's keep-alive connection.
+
+    Chained calls (e.g. move_issue_to_state) then pay for one TLS handshake
+    instead of one per request.
+
+    Returns:
+        Tuple of (HTTP status, response body).
+    """
+    while True:
+        conn = getattr(_local, "conn", None)
+        reused = conn is not None
+        if conn is None:
+            conn = http.client.HTTPSConnection(LINEAR_API_HOST, timeout=30)
+            _local.conn = conn
+        try:
+            conn.request("POST", "/graphql", body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.read()
+        except http.client.RemoteDisconnected:
+            # The server closed an idle connection without answering, so even a
+            # mutation wasn't handled; reconnect and retry once. Other resets may
+            # come after issueCreate/commentCreate ran, so they aren't resent.
+            _reset_connection()
+            if not reused:
+                raise
+        except Exception:
+            # e.g. a timeout mid-response leaves the connection unusable
+            _reset_connection()
+            raise
+
+
 def graphql(query: str, variables: Optional[dict] = None) -> dict:
-    """Execute GraphQL query against Linear API."""
+    """
+    Execute GraphQL query against Linear API.
+
+    Raises:
+        LinearAPIError on network, HTTP, or GraphQL errors.
+    """
     auth_token = get_auth_token()
 
     payload = {"query": query}
     if variables:
         payload["variables"] = variables
 
-    data = json.dumps(payload).encode("utf-8")
+    data = _dumps(payload)
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": auth_token,
+    }
 
-    req = urllib.request.Request(
-        LINEAR_API_URL,
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": auth_token,
-        },
-        method="POST"
-    )
+    try:
+        for attempt in range(GRAPHQL_RETRIES + 1):
+            status, body = _post_graphql(data, headers)
+            if status not in GRAPHQL_RETRY_STATUSES or attempt == GRAPHQL_RETRIES:
+                break
+            time.sleep(GRAPHQL_RETRY_BACKOFF * 2 ** attempt)
+    except (OSError, http.client.HTTPException) as e:
+        raise LinearAPIError(f"Network Error: {e}")
+
+    if status >= 400:
+        if status == 401 and get_auth_method() == "client_credentials":
+            # A revoked token shouldn't be reused for the rest of its lifetime
+            _clear_cached_token()
+        raise LinearAPIError(f"HTTP Error {status}: {body.decode('utf-8', errors='replace')}")
 
     try:
-        with urllib.request.urlopen(req) as response:
-            result = json.loads(response.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8") if e.fp else str(e)
-        print(f"HTTP Error {e.code}: {error_body}", file=sys.stderr)
-        sys.exit(1)
-    except urllib.error.URLError as e:
-        print(f"Network Error: {e.reason}", file=sys.stderr)
-        sys.exit(1)
+        result = _loads(body)
+    except json.JSONDecodeError:
+        raise LinearAPIError(f"Invalid JSON response (HTTP {status})")
 
     if "errors" in result:
-        for err in result["errors"]:
-            print(f"GraphQL Error: {err.get('message', err)}", file=sys.stderr)
-        sys.exit(1)
+        raise LinearAPIError("\n".join(f"GraphQL Error: {err.get('message', err)}" for err in result["errors"]))
 
     return result
 
 
+def _ttl_cache(seconds: int) -> Callable:
+    """Cache a function's result per positional arguments for a number of seconds."""
+    def decorator(func: Callable) -> Callable:
+        cache: dict[tuple, tuple[Any, float]] = {}
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            hit = cache.get(args)
+            if hit is not None and hit[1] > time.monotonic():
+                return hit[0]
+            value = func(*args)
+            cache[args] = (value, time.monotonic() + seconds)
+            return value
+        return wrapper
+    return decorator
+
+
 def get_viewer() -> dict:
     """Get current authenticated user info."""
     query = """
@@ -218,11 +377,16 @@ def get_viewer() -> dict:
     return result["data"]["viewer"]
 
 
-def get_teams() -> list[dict]:
-    """Get all teams the user has access to."""
+def get_teams(key: Optional[str] = None) -> list[dict]:
+    """
+    Get all teams the user has access to.
+
+    Args:
+        key: Only return the team with this key (case-insensitive), filtered server-side
+    """
     query = """
-    query {
-      teams {
+    query($filter: TeamFilter) {
+      teams(filter: $filter) {
         nodes {
           id
           key
@@ -231,31 +395,80 @@ def get_teams() -> list[dict]:
       }
     }
     """
-    result = graphql(query)
+    variables = {"filter": {"key": {"eqIgnoreCase": key}}} if key else None
+    result = graphql(query, variables)
     return result["data"]["teams"]["nodes"]
 
 
+def _team_cache_file() -> Path:
+    """Team cache path for the current credentials (different keys may see different workspaces)."""
+    digest = hashlib.sha256(get_auth_token().encode("utf-8")).hexdigest()[:16]
+    return TEAM_CACHE_DIR / f"teams-{digest}.json"
+
+
+def _team_cache_disabled() -> bool:
+    """Whether LINEAR_DEV_FLOW_NOCACHE=1 turns the on-disk team cache off (reads and writes)."""
+    return os.environ.get("LINEAR_DEV_FLOW_NOCACHE") == "1"
+
+
+def _read_cached_team(team_key: Optional[str]) -> Optional[dict]:
+    """Return a team persisted by an earlier run, if still fresh."""
+    if _team_cache_disabled():
+        return None
+    try:
+        entry = json.loads(_team_cache_file().read_text())[(team_key or "").upper()]
+        if time.time() - entry["ts"] < TEAM_CACHE_SECONDS:
+            return entry["team"]
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_cached_team(team_key: Optional[str], team: dict) -> None:
+    """Persist a resolved team. Failures are ignored; the cache is best-effort."""
+    if _team_cache_disabled():
+        return
+    path = _team_cache_file()
+    try:
+        entries = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        entries = {}
+    if not isinstance(entries, dict):
+        entries = {}
+    entries[(team_key or "").upper()] = {"team": team, "ts": time.time()}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entries))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+@_ttl_cache(WORKFLOW_CACHE_SECONDS)
 def get_team(team_key: Optional[str] = None) -> dict:
     """Get team by key, or first team if not specified."""
     team_key = team_key or os.environ.get("LINEAR_TEAM_KEY")
-    teams = get_teams()
-
-    if not teams:
-        print("Error: No teams found", file=sys.stderr)
-        sys.exit(1)
+    cached = _read_cached_team(team_key)
+    if cached:
+        return cached
 
     if team_key:
-        for team in teams:
-            if team["key"].upper() == team_key.upper():
-                return team
-        available = ", ".join(t["key"] for t in teams)
-        print(f"Error: Team '{team_key}' not found. Available: {available}", file=sys.stderr)
-        sys.exit(1)
-
-    # Return first team
+        teams = get_teams(team_key)
+        if not teams:
+            available = ", ".join(t["key"] for t in get_teams())
+            raise LinearAPIError(f"Error: Team '{team_key}' not found. Available: {available}")
+    else:
+        teams = get_teams()
+        if not teams:
+            raise LinearAPIError("Error: No teams found")
+
+    # Matching team, or the first team
+    _write_cached_team(team_key, teams[0])
     return teams[0]
 
 
+@_ttl_cache(WORKFLOW_CACHE_SECONDS)
 def get_workflow_states(team_id: str) -> list[dict]:
     """Get all workflow states for a team."""
     query = """
@@ -327,6 +540,71 @@ def get_issue(issue_identifier: str) -> dict:
     return result["data"]["issue"]
 
 
+def get_issue_ref(issue_identifier: str) -> dict:
+    """
+    Get just an issue's id, title and URL by identifier (e.g., "ASA-42").
+
+    Much lighter than get_issue for callers that only need to address the issue.
+    """
+    query = """
+    query($identifier: String!) {
+      issue(id: $identifier) {
+        id
+        title
+        url
+      }
+    }
+    """
+    result = graphql(query, {"identifier": issue_identifier})
+    return result["data"]["issue"]
+
+
+# Fields and ordering shared by the issue list queries
+ISSUE_LIST_FRAGMENT = """
+fragment IssueListFields on IssueConnection {
+  nodes {
+    id
+    identifier
+    title
+    priority
+    priorityLabel
+    state {
+      id
+      name
+      type
+    }
+    assignee {
+      name
+    }
+    createdAt
+    url
+  }
+}
+"""
+# Just what pickup needs to rank and display candidates (same fragment name, so it's a drop-in)
+PICKUP_ISSUE_FRAGMENT = """
+fragment IssueListFields on IssueConnection {
+  nodes {
+    id
+    identifier
+    title
+    priority
+    priorityLabel
+    createdAt
+    url
+  }
+}
+"""
+ISSUE_LIST_SORT = "[{ priority: { order: Ascending, noPriorityFirst: false } }, { createdAt: { order: Ascending } }]"
+
+
+def _issue_filter(team_id: str, state_name: Optional[str]) -> dict[str, Any]:
+    issue_filter: dict[str, Any] = {"team": {"id": {"eq": team_id}}}
+    if state_name:
+        issue_filter["state"] = {"name": {"eqIgnoreCase": state_name}}
+    return issue_filter
+
+
 def list_issues(
     team_id: str,
     state_name: Optional[str] = None,
@@ -337,46 +615,42 @@ def list_issues(
 
     Returns issues sorted by priority (highest first), then by creation date.
     """
-    # Build filter
-    filter_parts = [f'team: {{ id: {{ eq: "{team_id}" }} }}']
+    return list_issues_by_states(team_id, [state_name], limit)[state_name]
 
-    if state_name:
-        filter_parts.append(f'state: {{ name: {{ eqIgnoreCase: "{state_name}" }} }}')
-
-    filter_str = ", ".join(filter_parts)
-
-    query = f"""
-    query {{
-      issues(
-        filter: {{ {filter_str} }}
-        first: {limit}
-        sort: [
-          {{ priority: {{ order: Ascending, noPriorityFirst: false }} }},
-          {{ createdAt: {{ order: Ascending }} }}
-        ]
-      ) {{
-        nodes {{
-          id
-          identifier
-          title
-          priority
-          priorityLabel
-          state {{
-            id
-            name
-            type
-          }}
-          assignee {{
-            name
-          }}
-          createdAt
-          url
-        }}
-      }}
-    }}
+
+def list_issues_by_states(
+    team_id: str,
+    state_names: list[Optional[str]],
+    limit: int = 50,
+    fragment: str = ISSUE_LIST_FRAGMENT
+) -> dict[Optional[str], list[dict]]:
     """
-    result = graphql(query)
-    return result["data"]["issues"]["nodes"]
+    List a team's issues for several workflow states in one request.
+
+    Each state gets its own aliased issues() selection (s0, s1, ...), so the
+    per-state limit and ordering match separate list_issues calls.
+
+    Args:
+        fragment: IssueListFields fragment selecting the node fields, e.g.
+            PICKUP_ISSUE_FRAGMENT for a smaller response
+
+    Returns:
+        Dict mapping each requested state name to its issues.
+    """
+    # Filters are passed as variables, so the query text only depends on the state count
+    variables: dict[str, Any] = {"first": limit}
+    params = ["$first: Int!"]
+    selections = []
+    for i, state_name in enumerate(state_names):
+        variables[f"f{i}"] = _issue_filter(team_id, state_name)
+        params.append(f"$f{i}: IssueFilter")
+        selections.append(
+            f"s{i}: issues(filter: $f{i}, first: $first, sort: {ISSUE_LIST_SORT}) {{ ...IssueListFields }}"
+        )
+
+    query = f"query({', '.join(params)}) {{\n  " + "\n  ".join(selections) + "\n}\n" + fragment
+    data = graphql(query, variables)["data"]
+    return {state_name: data[f"s{i}"]["nodes"] for i, state_name in enumerate(state_names)}
 
 
 def create_comment(issue_id: str, body: str) -> dict:
@@ -422,40 +696,65 @@ def update_issue_state(issue_id: str, state_id: str) -> dict:
     return result["data"]["issueUpdate"]
 
 
-def move_issue_to_state(issue_identifier: str, target_state_name: str) -> dict:
+def get_issue_with_target_state(issue_identifier: str, target_state_name: str) -> dict:
     """
-    Move an issue to a different workflow state by name.
+    Get an issue's id, title and URL plus the id of a workflow state in its team, in one request.
 
-    Args:
-        issue_identifier: Issue identifier like "ASA-42"
-        target_state_name: Target state name like "In Progress"
+    The state is matched by name (case-insensitive) on the server, so only that
+    state is returned rather than every state of the team.
+
+    Raises LinearAPIError if the issue or the state doesn't exist.
+
+    Returns:
+        Issue dict with a "targetState" {id, name}.
+    """
+    query = """
+    query($identifier: String!, $stateFilter: WorkflowStateFilter) {
+      issue(id: $identifier) {
+        id
+        title
+        url
+        team {
+          id
+          states(filter: $stateFilter) {
+            nodes {
+              id
+              name
+            }
+          }
+        }
+      }
+    }
     """
-    # Get issue to find team
-    issue = get_issue(issue_identifier)
+    variables = {
+        "identifier": issue_identifier,
+        "stateFilter": {"name": {"eqIgnoreCase": target_state_name.strip()}},
+    }
+    issue = graphql(query, variables)["data"]["issue"]
     if not issue:
-        print(f"Error: Issue {issue_identifier} not found", file=sys.stderr)
-        sys.exit(1)
+        raise LinearAPIError(f"Error: Issue {issue_identifier} not found")
 
-    # Extract team key from identifier (e.g., "ASA" from "ASA-42")
-    team_key = issue_identifier.split("-")[0]
-    team = get_team(team_key)
+    team = issue.pop("team")
+    states = team["states"]["nodes"]
+    if not states:
+        # Only the error path needs the full list
+        available = ", ".join(f'"{s["name"]}"' for s in get_workflow_states(team["id"]))
+        raise LinearAPIError(f"Error: State '{target_state_name}' not found. Available: {available}")
 
-    # Get workflow states for team
-    states = get_workflow_states(team["id"])
+    issue["targetState"] = states[0]
+    return issue
 
-    # Find target state (case-insensitive)
-    target_lower = target_state_name.lower().strip()
-    target_state = None
 
-    for state in states:
-        if state["name"].lower() == target_lower:
-            target_state = state
-            break
+def move_issue_to_state(issue_identifier: str, target_state_name: str) -> dict:
+    """
+    Move an issue to a different workflow state by name.
 
-    if not target_state:
-        available = ", ".join(f'"{s["name"]}"' for s in states)
-        print(f"Error: State '{target_state_name}' not found. Available: {available}", file=sys.stderr)
-        sys.exit(1)
+    Args:
+        issue_identifier: Issue identifier like "ASA-42"
+        target_state_name: Target state name like "In Progress"
+    """
+    issue = get_issue_with_target_state(issue_identifier, target_state_name)
+    target_state = issue["targetState"]
 
     # Update issue state
     result = update_issue_state(issue["id"], target_state["id"])
@@ -471,12 +770,12 @@ def test_connection() -> bool:
     try:
         viewer = get_viewer()
         return viewer is not None
-    except SystemExit:
+    except LinearAPIError:
         return False
 
 
-if __name__ == "__main__":
-    # Quick test
+def _print_connection_report() -> None:
+    """Print the authenticated user, teams, and first team's workflow states."""
     print("Testing Linear API connection...")
 
     auth_method = get_auth_method()
@@ -496,3 +795,12 @@ if __name__ == "__main__":
         states = get_workflow_states(team["id"])
         for state in states:
             print(f"  - {state['name']} ({state['type']})")
+
+
+if __name__ == "__main__":
+    # Quick test
+    try:
+        _print_connection_report()
+    except LinearAPIError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
@@ -40,26 +40,43 @@ from pathlib import Path
 from typing import Optional
 
 from linear_api import (
+    LinearAPIError,
+    PICKUP_ISSUE_FRAGMENT,
     get_team,
     get_issue,
+    get_issue_ref,
+    get_issue_with_target_state,
     get_workflow_states,
     list_issues as api_list_issues,
+    list_issues_by_states,
     create_comment,
+    update_issue_state,
     move_issue_to_state,
 )
 from workflow_states import (
     normalize_state_name,
     sort_issues_by_priority,
+    highest_priority_issue,
     AGENT_PICKUP_STATES,
 )
 
+# Patterns for slugify, compiled once
+_SLUG_STRIP = re.compile(r'[^a-z0-9\s-]')
+# Underscores are already stripped, so any run of whitespace/dashes becomes one dash
+_SLUG_SEPARATOR = re.compile(r'[\s-]+')
+
+# Issues are referenced as "ASA-42" (team key, dash, number) or by their UUID,
+# both of which Linear's issue(id:) accepts
+_IDENTIFIER_RE = re.compile(
+    r'^(?:[A-Za-z][A-Za-z0-9]*-\d+|[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12})$'
+)
+
 
 def slugify(text: str, max_length: int = 50) -> str:
     """Convert text to URL-friendly slug."""
     slug = text.lower()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug)
+    slug = _SLUG_STRIP.sub('', slug)
+    slug = _SLUG_SEPARATOR.sub('-', slug)
     slug = slug.strip('-')
     return slug[:max_length]
 
@@ -89,23 +106,19 @@ def pickup_issue(status: Optional[str] = None) -> Optional[dict]:
     # If no status specified, check agent pickup states
     statuses_to_check = [status] if status else AGENT_PICKUP_STATES
 
-    all_issues = []
-    for state in statuses_to_check:
-        normalized = normalize_state_name(state)
-        if not normalized:
-            continue
+    normalized_states = [n for n in map(normalize_state_name, statuses_to_check) if n]
+    if not normalized_states:
+        return None
 
-        issues = api_list_issues(team["id"], state_name=normalized)
+    # One request for all candidate states
+    all_issues = []
+    by_state = list_issues_by_states(team["id"], normalized_states, fragment=PICKUP_ISSUE_FRAGMENT)
+    for normalized, issues in by_state.items():
         for issue in issues:
             issue["_pickup_state"] = normalized
             all_issues.append(issue)
 
-    if not all_issues:
-        return None
-
-    # Sort by priority and return first
-    sorted_issues = sort_issues_by_priority(all_issues)
-    return sorted_issues[0] if sorted_issues else None
+    return highest_priority_issue(all_issues)
 
 
 def show_issue(identifier: str) -> None:
@@ -144,7 +157,7 @@ def show_issue(identifier: str) -> None:
 
 def post_comment(identifier: str, body: str) -> None:
     """Post a comment to an issue."""
-    issue = get_issue(identifier)
+    issue = get_issue_ref(identifier)
     if not issue:
         print(f"Issue {identifier} not found", file=sys.stderr)
         sys.exit(1)
@@ -164,10 +177,8 @@ def move_issue(identifier: str, target_state: str) -> None:
 
 def post_completion(identifier: str, summary: str, confidence: int) -> None:
     """Post a structured completion comment and move to In Review."""
-    issue = get_issue(identifier)
-    if not issue:
-        print(f"Issue {identifier} not found", file=sys.stderr)
-        sys.exit(1)
+    issue = get_issue_with_target_state(identifier, "In Review")
+    target_state = issue["targetState"]
 
     branch = f"issue/{identifier.lower()}-{slugify(issue['title'])}"
 
@@ -186,6 +197,7 @@ def post_completion(identifier: str, summary: str, confidence: int) -> None:
 ---
 *Awaiting human review. Move to Done if acceptable, or back to Dev Ready with feedback.*
 """
+    # Only move to In Review once the comment is confirmed
     result = create_comment(issue['id'], comment_body)
     if result.get('success'):
         print(f"Completion comment posted to {identifier}")
@@ -193,8 +205,12 @@ def post_completion(identifier: str, summary: str, confidence: int) -> None:
         print(f"Failed to post completion comment", file=sys.stderr)
         sys.exit(1)
 
-    # Move to In Review
-    move_issue_to_state(identifier, "In Review")
+    result = update_issue_state(issue['id'], target_state['id'])
+    if result.get('success'):
+        print(f"Moved {identifier} to '{target_state['name']}'")
+    else:
+        print(f"Failed to move {identifier} to '{target_state['name']}'", file=sys.stderr)
+        sys.exit(1)
 
 
 def list_states() -> None:
@@ -209,6 +225,12 @@ def list_states() -> None:
         print(f"  - {state['name']} ({state_type})")
 
 
+def _die(message: str) -> None:
+    """Print an error and exit; API errors only become exits here, at the CLI boundary."""
+    print(message, file=sys.stderr)
+    sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Linear dev workflow CLI")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -249,6 +271,19 @@ def main():
 
     args = parser.parse_args()
 
+    try:
+        run_command(args)
+    except LinearAPIError as e:
+        _die(str(e))
+
+
+def run_command(args: argparse.Namespace) -> None:
+    """Run the parsed CLI command."""
+    # Reject malformed identifiers before spending a request on them
+    identifier = getattr(args, "identifier", None)
+    if identifier is not None and not _IDENTIFIER_RE.match(identifier):
+        _die(f"Error: Invalid issue identifier '{identifier}' (expected e.g. ASA-42 or an issue UUID)")
+
     if args.command == "list":
         issues = list_issues(args.status)
         if args.format == "json":
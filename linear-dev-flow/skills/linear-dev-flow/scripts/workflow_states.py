@@ -51,6 +51,19 @@ STATE_ALIASES = {
     "closed": "Done",
 }
 
+# Every accepted spelling (lowercase) -> canonical state name, for O(1) lookups
+_NORMALIZED_NAMES = {**{state.lower(): state for state in WORKFLOW_STATES}, **STATE_ALIASES}
+
+# Position of each state in the workflow
+_STATE_INDEX = {state: i for i, state in enumerate(WORKFLOW_STATES)}
+
+# Backward transitions that are allowed
+VALID_BACKWARD_TRANSITIONS = frozenset({
+    ("In Review", "Dev Ready"),  # Human rejects
+    ("In Progress", "Dev Ready"),  # Agent hit blocker
+    ("Dev Ready", "Todo"),  # Need more planning
+})
+
 # States where agent can pick up work
 AGENT_PICKUP_STATES = ["Todo", "Dev Ready"]
 
@@ -122,18 +135,7 @@ def normalize_state_name(name: str) -> Optional[str]:
     Returns:
         Canonical state name or None if not recognized
     """
-    normalized = name.lower().strip()
-
-    # Check aliases
-    if normalized in STATE_ALIASES:
-        return STATE_ALIASES[normalized]
-
-    # Check direct match (case-insensitive)
-    for state in WORKFLOW_STATES:
-        if state.lower() == normalized:
-            return state
-
-    return None
+    return _NORMALIZED_NAMES.get(name.lower().strip())
 
 
 def is_valid_transition(from_state: str, to_state: str) -> bool:
@@ -150,20 +152,10 @@ def is_valid_transition(from_state: str, to_state: str) -> bool:
         return False
 
     # All forward transitions are valid
-    from_idx = WORKFLOW_STATES.index(from_norm)
-    to_idx = WORKFLOW_STATES.index(to_norm)
-
-    if to_idx >= from_idx:
+    if _STATE_INDEX[to_norm] >= _STATE_INDEX[from_norm]:
         return True
 
-    # Valid backward transitions
-    valid_backwards = [
-        ("In Review", "Dev Ready"),  # Human rejects
-        ("In Progress", "Dev Ready"),  # Agent hit blocker
-        ("Dev Ready", "Todo"),  # Need more planning
-    ]
-
-    return (from_norm, to_norm) in valid_backwards
+    return (from_norm, to_norm) in VALID_BACKWARD_TRANSITIONS
 
 
 def get_priority_rank(priority: int) -> int:
@@ -175,6 +167,11 @@ def get_priority_rank(priority: int) -> int:
     return PRIORITY_ORDER.get(priority, 5)
 
 
+def _priority_key(issue: dict, _rank=PRIORITY_ORDER.get) -> tuple[int, str]:
+    # Rank lookup bound as a default instead of calling get_priority_rank per issue
+    return (_rank(issue.get("priority", 0), 5), issue.get("createdAt", ""))
+
+
 def sort_issues_by_priority(issues: list[dict]) -> list[dict]:
     """
     Sort issues by priority (highest first), then by creation date.
@@ -185,12 +182,17 @@ def sort_issues_by_priority(issues: list[dict]) -> list[dict]:
     Returns:
         Sorted list of issues
     """
-    def sort_key(issue):
-        priority = issue.get("priority", 0)
-        created = issue.get("createdAt", "")
-        return (get_priority_rank(priority), created)
+    return sorted(issues, key=_priority_key)
 
-    return sorted(issues, key=sort_key)
+
+def highest_priority_issue(issues: list[dict]) -> Optional[dict]:
+    """
+    Get the issue sort_issues_by_priority would put first, with one linear scan.
+
+    Returns:
+        Highest priority issue (oldest first on ties), or None if there are none
+    """
+    return min(issues, key=_priority_key, default=None)
 
 
 def get_next_pickup_issue(issues: list[dict], from_state: str = "Dev Ready") -> Optional[dict]:
@@ -208,18 +210,14 @@ def get_next_pickup_issue(issues: list[dict], from_state: str = "Dev Ready") ->
     if not state_norm:
         return None
 
-    # Filter to issues in target state
+    # Filter to issues in target state (lookup bound once for the loop)
+    lookup = _NORMALIZED_NAMES.get
     candidates = [
         issue for issue in issues
-        if normalize_state_name(issue.get("state", {}).get("name", "")) == state_norm
+        if lookup(issue.get("state", {}).get("name", "").lower().strip()) == state_norm
     ]
 
-    if not candidates:
-        return None
-
-    # Sort by priority and return first
-    sorted_issues = sort_issues_by_priority(candidates)
-    return sorted_issues[0] if sorted_issues else None
+    return highest_priority_issue(candidates)
 
 
 def validate_workflow_states(available_states: list[str]) -> dict:
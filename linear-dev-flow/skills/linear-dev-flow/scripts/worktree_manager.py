@@ -26,9 +26,12 @@ Dependencies:
 """
 
 import argparse
+import json
+import os
 import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -36,6 +39,14 @@ from typing import Optional
 # Path to shared git-worktree skill
 GIT_WORKTREE_SKILL = Path.home() / ".claude" / "skills" / "git-worktree" / "scripts" / "worktree_manager.py"
 
+# Issue titles seen before, so branch names stay stable and remove skips the API
+TITLE_CACHE_FILE = Path.home() / ".cache" / "linear-dev-flow" / "titles.json"
+
+# Patterns for slugify, compiled once
+_SLUG_STRIP = re.compile(r'[^a-z0-9\s-]')
+# Underscores are already stripped, so any run of whitespace/dashes becomes one dash
+_SLUG_SEPARATOR = re.compile(r'[\s-]+')
+
 
 def run_cmd(cmd: list[str], capture: bool = True, check: bool = True, cwd: Optional[Path] = None) -> str:
     """Run a shell command."""
@@ -50,11 +61,13 @@ def run_git(*args: str, cwd: Optional[Path] = None) -> str:
     return run_cmd(["git"] + list(args), cwd=cwd)
 
 
+@lru_cache(maxsize=1)
 def get_repo_root() -> Path:
     """Get git repository root."""
     return Path(run_git("rev-parse", "--show-toplevel"))
 
 
+@lru_cache(maxsize=1)
 def get_repo_name() -> str:
     """Get repository name."""
     return get_repo_root().name
@@ -63,22 +76,60 @@ def get_repo_name() -> str:
 def slugify(text: str, max_length: int = 50) -> str:
     """Convert text to URL-friendly slug."""
     slug = text.lower()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug)
+    slug = _SLUG_STRIP.sub('', slug)
+    slug = _SLUG_SEPARATOR.sub('-', slug)
     slug = slug.strip('-')
     return slug[:max_length]
 
 
+def _load_title_cache() -> dict[str, str]:
+    if os.environ.get("LINEAR_DEV_FLOW_NOCACHE") == "1":
+        return {}
+    try:
+        titles = json.loads(TITLE_CACHE_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return titles if isinstance(titles, dict) else {}
+
+
+def _save_title(identifier: str, title: str) -> None:
+    """Add a title to the on-disk cache. Failures are ignored; the cache is best-effort."""
+    titles = _load_title_cache()
+    titles[identifier] = title
+    try:
+        TITLE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = TITLE_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(titles))
+        os.replace(tmp, TITLE_CACHE_FILE)
+    except OSError:
+        pass
+
+
+# linear_api.get_issue_ref, imported on first use so commands that don't need it skip the import
+_get_issue_ref = None
+
+
+@lru_cache(maxsize=512)
 def get_issue_title_from_linear(identifier: str) -> Optional[str]:
-    """Get issue title from Linear API (if available)."""
+    """Get issue title from the title cache, or the Linear API (if available)."""
+    identifier = identifier.upper()
+    cached = _load_title_cache().get(identifier)
+    if cached:
+        return cached
+
+    global _get_issue_ref
     try:
-        from linear_api import get_issue
-        issue = get_issue(identifier)
-        return issue.get('title') if issue else None
+        if _get_issue_ref is None:
+            from linear_api import get_issue_ref as _get_issue_ref
+        issue = _get_issue_ref(identifier)
+        title = issue.get('title') if issue else None
     except (ImportError, SystemExit, Exception):
         return None
 
+    if title:
+        _save_title(identifier, title)
+    return title
+
 
 def branch_name_for_issue(identifier: str, title: Optional[str] = None) -> str:
     """
@@ -104,6 +155,24 @@ def branch_name_for_issue(identifier: str, title: Optional[str] = None) -> str:
     return f"issue/{identifier_lower}"
 
 
+def find_worktree_branch(identifier: str) -> Optional[str]:
+    """Find the branch of an existing worktree for an issue, without asking Linear."""
+    # git filters to this issue's branches, so no other worktree is listed or parsed;
+    # %(worktreepath) is empty for branches that aren't checked out in a worktree
+    identifier_lower = identifier.lower()
+    output = run_git(
+        "for-each-ref",
+        "--format=%(worktreepath)%00%(refname:short)",
+        f"refs/heads/issue/{identifier_lower}-*",
+        f"refs/heads/issue/{identifier_lower}",
+    )
+    for line in output.splitlines():
+        worktree, _, branch = line.partition("\0")
+        if worktree:
+            return branch
+    return None
+
+
 def check_git_worktree_skill() -> bool:
     """Check if git-worktree skill is installed."""
     if not GIT_WORKTREE_SKILL.exists():
@@ -127,7 +196,7 @@ def create_worktree(identifier: str, title: Optional[str] = None, path: Optional
 
     # Calculate worktree path if not provided
     repo_root = get_repo_root()
-    repo_name = get_repo_name()
+    repo_name = repo_root.name
     if not path:
         worktree_path = repo_root.parent / f"{repo_name}-{branch.replace('/', '-')}"
     else:
@@ -156,8 +225,8 @@ def remove_worktree(identifier: str) -> None:
     if not check_git_worktree_skill():
         sys.exit(1)
 
-    # Generate branch name from issue (without title, will match by identifier)
-    branch = branch_name_for_issue(identifier)
+    # Reuse the existing worktree's branch; only derive it from the title if there is none
+    branch = find_worktree_branch(identifier) or branch_name_for_issue(identifier)
     print(f"Removing worktree for issue {identifier}")
     print(f"Branch pattern: {branch}")
 